@@ -9,6 +9,7 @@
 #   bash scripts/pull_models.sh          # download everything
 #   bash scripts/pull_models.sh cuda     # whisper-small + kokoro (CUDA profile)
 #   bash scripts/pull_models.sh cpu      # whisper-base-int8 + piper (CPU profile)
+#   bash scripts/pull_models.sh w8a16    # weight-only INT8 Whisper base (CPU fallback)
 #   bash scripts/pull_models.sh stt      # all STT models only
 #   bash scripts/pull_models.sh tts      # all TTS models only
 # ============================================================
@@ -110,6 +111,49 @@ download_whisper_base() {
     ok "Whisper base INT8 ready"
 }
 
+# ============================================================
+# STT: Whisper base W8A16  (weight-only INT8 auto-switch fallback)
+# Quantizes the FP32 base.en export with MatMulNBits (bits=8).
+# Faster than dynamic INT8 on CPUs without VNNI.
+# Requires: pip install onnx onnxruntime>=1.21
+# Expected paths:
+#   models/stt/whisper-base-w8a16-encoder.onnx
+#   models/stt/whisper-base-w8a16-decoder.onnx
+# ============================================================
+quantize_whisper_w8a16() {
+    local SRC="$STT_DIR/sherpa-onnx-whisper-base.en"
+
+    if [[ -f "$STT_DIR/whisper-base-w8a16-encoder.onnx" ]]; then
+        ok "Whisper base W8A16 already exists — skipping"
+        return
+    fi
+
+    download_whisper_base
+    if [[ ! -d "$SRC" ]]; then
+        warn "FP32 Whisper base.en export not found at $SRC — remove models/stt/whisper-base-int8-*.onnx and re-run"
+        return
+    fi
+
+    info "Quantizing Whisper base.en to weight-only INT8 (W8A16) ..."
+    python - "$SRC" "$STT_DIR" <<'PYEOF'
+import sys
+import onnx
+from onnxruntime.quantization.matmul_nbits_quantizer import (
+    MatMulNBitsQuantizer, DefaultWeightOnlyQuantConfig,
+)
+
+src, dst = sys.argv[1], sys.argv[2]
+for part in ("encoder", "decoder"):
+    model = onnx.load(f"{src}/base.en-{part}.onnx")
+    cfg = DefaultWeightOnlyQuantConfig(block_size=32, is_symmetric=True, bits=8)
+    quant = MatMulNBitsQuantizer(model, algo_config=cfg)
+    quant.process()
+    quant.model.save_model_to_file(f"{dst}/whisper-base-w8a16-{part}.onnx")
+PYEOF
+
+    ok "Whisper base W8A16 ready"
+}
+
 # ============================================================
 # STT: Zipformer English (NPU profile: configs/audio/npu.yaml)
 # Expected paths:
@@ -117,13 +161,17 @@ download_whisper_base() {
 #   models/stt/zipformer-decoder.onnx
 #   models/stt/zipformer-joiner.onnx
 #   models/stt/tokens.txt
+# Also keeps the bundled INT8 export as the streaming CPU
+# auto-switch fallback:
+#   models/stt/zipformer-int8-{encoder,decoder,joiner}.onnx
+#   models/stt/zipformer-tokens.txt
 # ============================================================
 download_zipformer() {
     local ARCHIVE="sherpa-onnx-streaming-zipformer-en-2023-02-21.tar.bz2"
     local URL="${GH_BASE}/asr-models/${ARCHIVE}"
     local EXTRACT_DIR="sherpa-onnx-streaming-zipformer-en-2023-02-21"
 
-    if [[ -f "$STT_DIR/zipformer-encoder.onnx" ]]; then
+    if [[ -f "$STT_DIR/zipformer-encoder.onnx" && -f "$STT_DIR/zipformer-int8-encoder.onnx" ]]; then
         ok "Zipformer already exists — skipping"
         return
     fi
@@ -139,7 +187,12 @@ download_zipformer() {
     cp "$SRC"/decoder-epoch-99-avg-1.onnx  "$STT_DIR/zipformer-decoder.onnx"  2>/dev/null || true
     cp "$SRC"/joiner-epoch-99-avg-1.onnx   "$STT_DIR/zipformer-joiner.onnx"   2>/dev/null || true
 
+    cp "$SRC"/encoder-epoch-99-avg-1.int8.onnx  "$STT_DIR/zipformer-int8-encoder.onnx"  2>/dev/null || true
+    cp "$SRC"/decoder-epoch-99-avg-1.int8.onnx  "$STT_DIR/zipformer-int8-decoder.onnx"  2>/dev/null || true
+    cp "$SRC"/joiner-epoch-99-avg-1.int8.onnx   "$STT_DIR/zipformer-int8-joiner.onnx"   2>/dev/null || true
+
     find "$SRC" -name "tokens.txt" -exec cp {} "$STT_DIR/tokens.txt" \; 2>/dev/null || true
+    find "$SRC" -name "tokens.txt" -exec cp {} "$STT_DIR/zipformer-tokens.txt" \; 2>/dev/null || true
 
     rm -f "$STT_DIR/$ARCHIVE"
     ok "Zipformer ready"
@@ -204,6 +257,44 @@ download_piper() {
     ok "Piper ready"
 }
 
+# ============================================================
+# TTS: weight-only INT8 (W8A16) variants for CPU synthesis
+# Expected paths (used automatically when provider is cpu):
+#   models/tts/kokoro-w8a16.onnx
+#   models/tts/piper-en-w8a16.onnx
+# Dynamic INT8 routes VITS convs through slow QLinear kernels;
+# weight-only keeps activations FP32 and only packs MatMul weights.
+# ============================================================
+quantize_tts_w8a16() {
+    local NAME
+    for NAME in kokoro piper-en; do
+        if [[ ! -f "$TTS_DIR/$NAME.onnx" ]]; then
+            continue
+        fi
+        if [[ -f "$TTS_DIR/$NAME-w8a16.onnx" ]]; then
+            ok "$NAME W8A16 already exists — skipping"
+            continue
+        fi
+
+        info "Quantizing $NAME TTS to weight-only INT8 (W8A16) ..."
+        python - "$TTS_DIR/$NAME.onnx" "$TTS_DIR/$NAME-w8a16.onnx" <<'PYEOF'
+import sys
+import onnx
+from onnxruntime.quantization.matmul_nbits_quantizer import (
+    MatMulNBitsQuantizer, DefaultWeightOnlyQuantConfig,
+)
+
+src, dst = sys.argv[1], sys.argv[2]
+model = onnx.load(src)
+cfg = DefaultWeightOnlyQuantConfig(block_size=32, is_symmetric=True, bits=8)
+quant = MatMulNBitsQuantizer(model, algo_config=cfg)
+quant.process()
+quant.model.save_model_to_file(dst)
+PYEOF
+        ok "$NAME W8A16 ready"
+    done
+}
+
 # ============================================================
 # VAD: Silero VAD  (shared across all audio profiles)
 # Expected path: models/vad/silero_vad.onnx
@@ -249,6 +340,10 @@ case "$PROFILE" in
         download_whisper_base
         download_piper
         ;;
+    w8a16)
+        quantize_whisper_w8a16
+        quantize_tts_w8a16
+        ;;
     npu)
         download_vad
         download_zipformer
@@ -276,7 +371,7 @@ case "$PROFILE" in
         download_piper
         ;;
     *)
-        echo "Usage: bash scripts/pull_models.sh [cuda|cpu|npu|stt|tts|vad|all]"
+        echo "Usage: bash scripts/pull_models.sh [cuda|cpu|w8a16|npu|stt|tts|vad|all]"
         exit 1
         ;;
 esac
@@ -66,15 +66,18 @@ def summarize_node(state: IkarisState, llm):
     """Compresses conversation history when it grows too large."""
     messages = state["messages"]
     existing_summary = state.get("summary", "")
+    summary_idx = state.get("summary_idx", 0)
     
-    new_summary, trimmed = summarize_history(messages, llm, existing_summary)
+    new_summary, trimmed, new_idx = summarize_history(messages, llm, existing_summary, summary_idx)
     
-    if new_summary != existing_summary:
+    if trimmed is not messages:  # History was folded into a new summary
         # Prepend summary context so the LLM always has history awareness
         summary_msg = SystemMessage(content=f"[Conversation Summary]: {new_summary}")
-        return {"messages": [summary_msg] + trimmed, "summary": new_summary}
+        return {"messages": [summary_msg] + trimmed, "summary": new_summary,
+                "summary_idx": new_idx}
     
-    return {"messages": [], "summary": existing_summary}
+    # Nothing summarized; new_idx differs only when a stale index was reset
+    return {"messages": [], "summary": existing_summary, "summary_idx": new_idx}
 
 def router_logic(state: IkarisState) -> Literal["hardware_node", "agent_planning_node", "logseq_node", "research_node", "llm_node"]:
     """Decides where to send the user's request with improved intelligence."""
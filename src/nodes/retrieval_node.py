@@ -30,11 +30,15 @@ def retrieval_node(state, tools):
     pubmed_tool = next((t for t in tools if type(t).__name__ == "PubMedTool"), None)
         
     all_evidence: list[Evidence] = []
+    questions = questions[:2]
 
-    for q in questions[:2]:
+    # One batched FAISS search for all questions (single index load + search)
+    faiss_batches = paper_tool.query_batch(questions) if paper_tool else []
+
+    for i, q in enumerate(questions):
         # --- Source 1: FAISS (local PDFs) ---
         if paper_tool:
-            faiss_results = paper_tool.query(q)
+            faiss_results = faiss_batches[i]
             all_evidence.extend(faiss_results)
             log.info(f"[Retrieval] FAISS returned {len(faiss_results)} chunks for: '{q[:50]}...'")
 
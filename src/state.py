@@ -8,6 +8,7 @@ class IkarisState(TypedDict):
     hardware_info: str
     # Rolling conversation summary (for SQLite bloat prevention)
     summary: str
+    summary_idx: int         # messages[:summary_idx] are already folded into summary
     
     # --- Agentic Control Fields ---
     goal: str                # Current research goal
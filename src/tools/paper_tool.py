@@ -1,7 +1,14 @@
 import os
 import re
+import glob
 import logging
-from langchain_community.document_loaders import PyPDFLoader, DirectoryLoader
+import platform
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import threading
+import collections
+import numpy as np
+from langchain_community.document_loaders import PyPDFLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_community.vectorstores import FAISS
@@ -11,27 +18,114 @@ log = logging.getLogger(__name__)
 
 # Lazy-load embeddings to prevent import-time side effects
 _embeddings_instance = None
+# The UI warms the model up on a background thread while queries can already
+# arrive on another, so construction is serialized
+_embeddings_lock = threading.Lock()
+
+_EMBED_MODEL = "all-MiniLM-L6-v2"
+# Bigger forward batches amortize per-batch overhead on ingest. MiniLM already
+# ends in a Normalize layer, so vectors are unchanged.
+_ENCODE_KWARGS = {'batch_size': 128, 'normalize_embeddings': True}
+
+def _onnx_int8_file() -> str:
+    """Pre-quantized (dynamic INT8) MiniLM export from the model repo, by CPU ISA."""
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "onnx/model_qint8_arm64.onnx"
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    flags = line.split()
+                    if "avx512_vnni" in flags:
+                        return "onnx/model_qint8_avx512_vnni.onnx"
+                    if "avx512f" in flags:
+                        return "onnx/model_qint8_avx512.onnx"
+                    break
+    except OSError:
+        pass
+    # The AVX2 export is unsigned INT8 — note quint8, not qint8
+    return "onnx/model_quint8_avx2.onnx"
+
+def _embed_device() -> str:
+    """IKARIS_EMBED_DEVICE = auto (default) | cuda | cpu. auto picks CUDA when
+    torch sees a GPU, so CPU-only machines and CI need no configuration."""
+    device = os.getenv("IKARIS_EMBED_DEVICE", "auto").lower()
+    if device != "auto":
+        return device
+    try:
+        import torch
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    except ImportError:
+        return "cpu"
 
 def get_embeddings():
     global _embeddings_instance
-    if _embeddings_instance is None:
-        _embeddings_instance = HuggingFaceEmbeddings(
-            model_name="all-MiniLM-L6-v2", 
-            model_kwargs={'device': 'cpu'}
-        )
+    if _embeddings_instance is not None:
+        return _embeddings_instance
+    with _embeddings_lock:
+        if _embeddings_instance is None:
+            # GPU: FP16 MiniLM with larger batches — indexing is the bottleneck and
+            # the forward pass is tiny next to the local LLM's VRAM footprint.
+            if _embed_device() == "cuda":
+                try:
+                    _embeddings_instance = HuggingFaceEmbeddings(
+                        model_name=_EMBED_MODEL,
+                        model_kwargs={'device': 'cuda', 'model_kwargs': {'torch_dtype': 'float16'}},
+                        encode_kwargs={**_ENCODE_KWARGS, 'batch_size': 256},
+                    )
+                    log.info("[PaperTool] Embeddings: CUDA FP16")
+                except Exception as e:
+                    log.warning(f"[PaperTool] CUDA embedder unavailable, using CPU: {e}")
+            # CPU: INT8 ONNX Runtime MiniLM by default (several times faster than
+            # PyTorch FP32); IKARIS_EMBED_BACKEND=torch opts out. Needs
+            # sentence-transformers[onnx] — falls back to PyTorch if unavailable.
+            if _embeddings_instance is None and os.getenv("IKARIS_EMBED_BACKEND", "onnx").lower() == "onnx":
+                onnx_file = _onnx_int8_file()
+                try:
+                    _embeddings_instance = HuggingFaceEmbeddings(
+                        model_name=_EMBED_MODEL,
+                        model_kwargs={
+                            'device': 'cpu',
+                            'backend': 'onnx',
+                            'model_kwargs': {'file_name': onnx_file},
+                        },
+                        encode_kwargs=_ENCODE_KWARGS,
+                    )
+                    log.info(f"[PaperTool] Embeddings: ONNX Runtime INT8 ({onnx_file})")
+                except Exception as e:
+                    log.warning(f"[PaperTool] ONNX INT8 embedder ({onnx_file}) failed to load, "
+                                f"falling back to PyTorch FP32: {e}")
+            if _embeddings_instance is None:
+                log.info("[PaperTool] Embeddings: PyTorch FP32 (CPU)")
+                _embeddings_instance = HuggingFaceEmbeddings(
+                    model_name=_EMBED_MODEL, 
+                    model_kwargs={'device': 'cpu'},
+                    encode_kwargs=_ENCODE_KWARGS,
+                )
     return _embeddings_instance
 
 from src.workspaces.workspace_manager import WorkspaceManager
 
+# All anchor kinds fused into one alternation, compiled once at import. The
+# named digit group is the match's lastgroup, which says which kind it is.
+_ANCHOR_RE = re.compile(
+    r'(?:Section|Sec\.?)\s*(?P<sections>\d+(?:\.\d+)*)'
+    r'|(?:Equation|Eq\.?)\s*\(?(?P<equations>\d+)\)?'
+    r'|(?:Figure|Fig\.?)\s*(?P<figures>\d+)'
+    r'|(?:Table|Tab\.?)\s*(?P<tables>\d+)',
+    re.IGNORECASE,
+)
+
 def extract_metadata_anchors(text: str) -> dict:
     """Extracts immutable anchors and infers hierarchy for Layer 3 (Graph)."""
-    flat_anchors = {
-        "sections": re.findall(r'(?:Section|Sec\.?)\s*(\d+(?:\.\d+)*)', text, re.IGNORECASE),
-        "equations": re.findall(r'(?:Equation|Eq\.?)\s*\(?(\d+)\)?', text, re.IGNORECASE),
-        "figures": re.findall(r'(?:Figure|Fig\.?)\s*(\d+)', text, re.IGNORECASE),
-        "tables": re.findall(r'(?:Table|Tab\.?)\s*(\d+)', text, re.IGNORECASE),
-    }
-    result = {k: sorted(list(set(v))) for k, v in flat_anchors.items() if v}
+    # Single scan over the text; every kind starts with a distinct letter, so
+    # the alternation finds exactly what the four separate findalls did.
+    # Dicts dedupe while keeping discovery order — anchors come back unsorted.
+    flat_anchors = {"sections": {}, "equations": {}, "figures": {}, "tables": {}}
+    for m in _ANCHOR_RE.finditer(text):
+        kind = m.lastgroup
+        flat_anchors[kind][m.group(kind)] = None
+    result = {k: list(v) for k, v in flat_anchors.items() if v}
     
     if "sections" in result:
         parent_sec = result["sections"][0]
@@ -45,6 +139,62 @@ def extract_metadata_anchors(text: str) -> dict:
         
     return result
 
+# Chunk boundaries, most preferred first: before a numbered section heading
+# line ("3 Method", "4.2. Results"), then paragraph, line, word. The heading
+# break is a zero-width lookahead, so the heading stays with its section.
+_SECTION_BREAK = r'\n(?=\d+(?:\.\d+)*\.?[ \t]+[A-Z][^\n]{0,80}\n)'
+_CHUNK_SEPARATORS = [_SECTION_BREAK, r'\n\n', r'\n', r' ', r'']
+
+def is_pdf(name: str) -> bool:
+    """Case-insensitive .pdf check, shared by ingest and the sidebar listing."""
+    return os.path.splitext(name)[1].lower() == ".pdf"
+
+# Below this many PDFs, parsing in-process beats spawning a worker pool
+_PARALLEL_PDF_MIN = 4
+
+def _load_pdf(path: str) -> list:
+    """Parses one PDF into per-page Documents (top-level, so pool workers can import it)."""
+    return PyPDFLoader(path).load()
+
+def _load_pdfs(papers_path: str) -> list:
+    """
+    Loads every PDF in papers_path. pypdf extraction is pure-Python and holds the
+    GIL, so larger batches are parsed across processes. Workers are spawned, not
+    forked — ingest runs on a Qt worker thread, and forking a threaded process is
+    unsafe. Documents keep file (sorted) then page order.
+    """
+    paths = sorted(p for p in glob.glob(os.path.join(papers_path, "*")) if is_pdf(p))
+    workers = min(len(paths), os.cpu_count() or 1)
+    if len(paths) < _PARALLEL_PDF_MIN or workers <= 1:
+        return [doc for path in paths for doc in _load_pdf(path)]
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context("spawn")) as pool:
+        # chunksize=1: one PDF per task, so a few huge files don't stall a worker's queue
+        return [doc for docs in pool.map(_load_pdf, paths, chunksize=1) for doc in docs]
+
+# Flat L2 is exact and fast enough for small libraries; past this many chunks
+# the index is rebuilt as HNSW so query cost grows ~log(N) instead of N
+_HNSW_MIN_CHUNKS = 2000
+_HNSW_M = 32
+_HNSW_EF_CONSTRUCTION = 200
+_HNSW_EF_SEARCH = 64
+
+def _hnsw_index(vectors):
+    """
+    HNSW graph over the chunk vectors, same L2 metric and row order as IndexFlatL2.
+    Vectors are stored as fp16, halving index memory and the bytes each distance
+    reads; the rounding is far below the gaps between MiniLM neighbours.
+    """
+    import faiss
+    xb = np.asarray(vectors, dtype=np.float32)
+    index = faiss.IndexHNSWSQ(xb.shape[1], faiss.ScalarQuantizer.QT_fp16, _HNSW_M)
+    index.hnsw.efConstruction = _HNSW_EF_CONSTRUCTION
+    index.hnsw.efSearch = _HNSW_EF_SEARCH  # Persisted with the index by save_local
+    index.train(xb)  # No-op for fp16, but required before add
+    index.add(xb)
+    return index
+
 def ingest_papers():
     """Chunks PDFs and creates a local vector store inside the active workspace."""
     wm = WorkspaceManager()
@@ -55,53 +205,183 @@ def ingest_papers():
         os.makedirs(papers_path)
         return f"Created '{papers_path}' folder. Please add PDFs and try again."
 
-    loader = DirectoryLoader(papers_path, glob="./*.pdf", loader_cls=PyPDFLoader)
-    documents = loader.load()
+    documents = _load_pdfs(papers_path)
     
     if not documents:
         return f"No PDFs found in the '{papers_path}' folder."
         
-    text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
+    text_splitter = RecursiveCharacterTextSplitter(
+        chunk_size=1000, chunk_overlap=100,
+        separators=_CHUNK_SEPARATORS, is_separator_regex=True,
+    )
     texts = text_splitter.split_documents(documents)
     
+    # One pass over the chunks: tag anchors and collect the embedding inputs
+    contents, metadatas = [], []
     for doc in texts:
-        anchors = extract_metadata_anchors(doc.page_content)
-        doc.metadata.update(anchors)
+        doc.metadata.update(extract_metadata_anchors(doc.page_content))
+        contents.append(doc.page_content)
+        metadatas.append(doc.metadata)
     
-    vectorstore = FAISS.from_documents(texts, get_embeddings())
+    # Embed every chunk in one explicit batched call, then build the index
+    # from the precomputed vectors
+    emb = get_embeddings()
+    vectors = emb.embed_documents(contents)
+    vectorstore = FAISS.from_embeddings(list(zip(contents, vectors)), emb, metadatas=metadatas)
+    if len(vectors) >= _HNSW_MIN_CHUNKS:
+        # Rows are added in the same order, so index_to_docstore_id still lines up
+        vectorstore.index = _hnsw_index(vectors)
     vectorstore.save_local(db_path)
+    # Hand the fresh store straight to the query side instead of having the next
+    # query read back what was just written
+    with _index_cache_lock:
+        stamp = _index_stamp(db_path)
+        if stamp is not None:
+            _index_cache[db_path] = (stamp, vectorstore)
+        else:
+            _index_cache.pop(db_path, None)
+    clear_query_cache()  # Cached results point at the old index
     return f"Successfully indexed {len(texts)} chunks with Layer 3 metadata anchors in workspace '{wm.get_active_workspace()}'."
 
-def query_papers(question: str) -> list:
-    """Retrieves relevant text as Evidence objects (Layer 3.5)."""
+# Query cache: repeat questions skip embedding + FAISS search. Keyed by index
+# path (workspaces never share hits) and index file stamp (an index rewritten
+# outside this process misses), cleared whenever ingest rewrites the index.
+_QUERY_CACHE_SIZE = 512
+_query_cache = collections.OrderedDict()  # (db_path, stamp, question, k) -> tuple[Evidence]
+_query_cache_lock = threading.Lock()
+
+def _cache_get(key):
+    with _query_cache_lock:
+        hit = _query_cache.get(key)
+        if hit is not None:
+            _query_cache.move_to_end(key)
+        return hit
+
+def _cache_put(key, evidence):
+    with _query_cache_lock:
+        _query_cache[key] = tuple(evidence)
+        _query_cache.move_to_end(key)
+        if len(_query_cache) > _QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+
+def clear_query_cache():
+    """Drops all cached query results (called after every successful ingest)."""
+    with _query_cache_lock:
+        _query_cache.clear()
+
+def _ensure_index():
+    """Resolves the workspace FAISS index, ingesting first if it doesn't exist yet.
+    Returns (db_path, None) or (None, error Evidence)."""
     wm = WorkspaceManager()
     db_path = wm.get_faiss_index_dir()
     
     if not os.path.exists(db_path):
         ingest_result = ingest_papers()
         if "Successfully indexed" not in ingest_result:
-            return [Evidence(source="faiss", id="error", title="Ingest Error", text=ingest_result)]
+            return None, Evidence(source="faiss", id="error", title="Ingest Error", text=ingest_result)
+    return db_path, None
+
+# Loaded vector stores, kept across queries: db_path -> (index file stamp, store).
+# The stamp (mtime_ns, size) changes whenever ingest rewrites the index.
+_index_cache = {}
+_index_cache_lock = threading.Lock()
+
+def _index_stamp(db_path):
+    """(mtime_ns, size) of the saved index file, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(os.path.join(db_path, "index.faiss"))
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def _load_index(db_path):
+    stamp = _index_stamp(db_path)  # None: can't tell if it changed, so don't cache
+    with _index_cache_lock:
+        cached = _index_cache.get(db_path)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            return cached[1]
+        db = FAISS.load_local(db_path, get_embeddings(), allow_dangerous_deserialization=True)
+        if stamp is not None:
+            _index_cache[db_path] = (stamp, db)
+        return db
+
+def _to_evidence(doc, score) -> Evidence:
+    relevance = 1.0 / (1.0 + score)
+    chunk_id = str(hash(doc.page_content))
+    return Evidence(
+        source="faiss",
+        id=chunk_id,
+        title=doc.metadata.get("source", "Unknown PDF"),
+        text=doc.page_content,
+        relevance=round(relevance, 2),
+        meta=doc.metadata,
+    )
+
+def query_papers(question: str) -> list:
+    """Retrieves relevant text as Evidence objects (Layer 3.5)."""
+    db_path, error = _ensure_index()
+    if error is not None:
+        return [error]
+
+    key = (db_path, _index_stamp(db_path), question, 5)
+    cached = _cache_get(key)
+    if cached is not None:
+        log.info(f"[PaperTool] Query cache hit ({len(cached)} evidence chunks).")
+        return list(cached)
         
-    db = FAISS.load_local(db_path, get_embeddings(), allow_dangerous_deserialization=True)
+    db = _load_index(db_path)
     docs_and_scores = db.similarity_search_with_score(question, k=5)
-    
-    evidence = []
-    for doc, score in docs_and_scores:
-        relevance = 1.0 / (1.0 + score)
-        chunk_id = str(hash(doc.page_content))
-        
-        evidence.append(Evidence(
-            source="faiss",
-            id=chunk_id,
-            title=doc.metadata.get("source", "Unknown PDF"),
-            text=doc.page_content,
-            relevance=round(relevance, 2),
-            meta=doc.metadata,
-        ))
+    evidence = [_to_evidence(doc, score) for doc, score in docs_and_scores]
+    _cache_put(key, evidence)
     
     log.info(f"[PaperTool] FAISS returned {len(evidence)} evidence chunks.")
     return evidence
 
+def query_papers_batch(questions: list, k: int = 5) -> list:
+    """
+    Batched query_papers: one index load, one embedding pass and one FAISS
+    search over all uncached questions. Returns one Evidence list per question,
+    in order.
+    """
+    if not questions:
+        return []
+    db_path, error = _ensure_index()
+    if error is not None:
+        return [[error] for _ in questions]
+
+    stamp = _index_stamp(db_path)
+    found = {}
+    misses = []
+    for q in dict.fromkeys(questions):
+        cached = _cache_get((db_path, stamp, q, k))
+        if cached is not None:
+            found[q] = cached
+        else:
+            misses.append(q)
+
+    if misses:
+        db = _load_index(db_path)
+        # Stack the query vectors and search them in a single call, bypassing the
+        # per-query LangChain wrapper. Flat and HNSW indexes both return raw L2,
+        # so distances match similarity_search_with_score.
+        xq = np.asarray(get_embeddings().embed_documents(misses), dtype=np.float32)
+        distances, indices = db.index.search(xq, k)
+
+        for q, row_d, row_i in zip(misses, distances, indices):
+            evidence = []
+            for score, i in zip(row_d, row_i):
+                if i == -1:  # Fewer than k vectors in the index
+                    continue
+                doc = db.docstore.search(db.index_to_docstore_id[i])
+                evidence.append(_to_evidence(doc, float(score)))
+            _cache_put((db_path, stamp, q, k), evidence)
+            found[q] = evidence
+
+    results = [list(found[q]) for q in questions]
+    log.info(f"[PaperTool] FAISS batch returned {sum(map(len, results))} evidence chunks "
+             f"for {len(questions)} queries ({len(questions) - len(misses)} cached).")
+    return results
+
 class PaperTool:
     name = "paper"
     description = "Search local PDF papers via FAISS"
@@ -113,5 +393,8 @@ class PaperTool:
     def query(self, question: str) -> list:
         return query_papers(question)
 
+    def query_batch(self, questions: list) -> list:
+        return query_papers_batch(questions)
+
     def ingest(self):
         return ingest_papers()
@@ -3,6 +3,7 @@ import sys
 os.environ["QT_QPA_PLATFORM"] = "xcb"
 
 import re
+import platform
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
     QSplitter, QApplication, QMessageBox
@@ -11,9 +12,26 @@ from PyQt5.QtCore import Qt
 from src.ui.chat_widget import ChatWidget
 from src.ui.sidebar_widget import SidebarWidget
 from src.ui.status_bar import StatusBarWidget
-from src.ui.workers import GraphWorker, LLMWorker, IndexWorker, VoiceWorker
+from src.ui.workers import GraphWorker, LLMWorker, IndexWorker, VoiceWorker, WarmupWorker
 from src.ui.evidence_viewer import EvidenceViewer
 from src.main import router_logic
+from langchain_core.messages import HumanMessage
+
+# Real OS details for the chat system prompt; fixed for the process lifetime
+_OS_INFO = f"{platform.system()} {platform.release()}"
+
+# Messages that need the full graph (hardware, arXiv, PubMed, papers, notes)
+# rather than plain streaming chat. Plain substring match, like the keyword
+# lists it replaces; one case-insensitive search stops at the first hit.
+_GRAPH_RE = re.compile(
+    r'battery|cpu|stats|hardware'
+    r'|arxiv\.org|download|fetch'
+    r'|pubmed|pmid'
+    r'|\d{4}\.\d{4,5}'
+    r'|paper|research|study|according to|search'
+    r'|note|logseq|journal|diary',  # "note" also covers "notes"
+    re.IGNORECASE,
+)
 
 
 class IkarisMainWindow(QMainWindow):
@@ -35,17 +53,33 @@ class IkarisMainWindow(QMainWindow):
         self._current_worker = None
         self._index_worker = None 
         self._voice_worker = None
+        self._warmup_worker = None
         self._last_evidence = []
 
         self.ikaris_app = agent.app if agent else None
         self._setup_ui()
         self._connect_signals()
+
+        # Load the embedding model off the UI thread before the first query needs
+        # it — only when the workspace has an index, so sessions that never
+        # search papers don't pay for (or put on the GPU) a model they won't use
+        index_file = os.path.join(self.sidebar.wm.get_faiss_index_dir(), "index.faiss")
+        if os.path.exists(index_file):
+            self._warmup_worker = WarmupWorker()
+            self._warmup_worker.start()
         
         # Phase 1 UX: Hide mic if audio is not capable of STT
         audio = self.agent.audio if self.agent else None
         if audio is None or not getattr(audio, 'has_stt', False):
             self.chat.voice_btn.hide()
 
+    def closeEvent(self, event):
+        # Model load can't be interrupted; let it finish rather than destroy a
+        # running QThread (Qt aborts on that)
+        if self._warmup_worker is not None and self._warmup_worker.isRunning():
+            self._warmup_worker.wait()
+        super().closeEvent(event)
+
     def _setup_ui(self):
         central = QWidget()
         self.setCentralWidget(central)
@@ -90,18 +124,8 @@ class IkarisMainWindow(QMainWindow):
         self.chat.add_user_message(text)
         self.chat.set_input_enabled(False)
 
-        # Check which route the message would take
-        msg_lower = text.lower()
-        
         # Hardware, research, paper, logseq, pubmed → use full graph (non-streaming)
-        needs_graph = (
-            any(w in msg_lower for w in ["battery", "cpu", "stats", "hardware"]) or
-            any(w in msg_lower for w in ["arxiv.org", "download", "fetch"]) or
-            any(w in msg_lower for w in ["pubmed", "pmid"]) or
-            bool(re.findall(r'\d{4}\.\d{4,5}', msg_lower)) or
-            any(w in msg_lower for w in ["paper", "research", "study", "according to", "search"]) or
-            any(w in msg_lower for w in ["note", "notes", "logseq", "journal", "diary"])
-        )
+        needs_graph = _GRAPH_RE.search(text) is not None
 
         if needs_graph:
             self._run_graph(text)
@@ -112,13 +136,9 @@ class IkarisMainWindow(QMainWindow):
         """Stream LLM tokens for general chat."""
         self.chat.start_ai_message()
 
-        # Import platform to get real OS details
-        import platform
-        os_info = f"{platform.system()} {platform.release()}"
-
         system_prompt = (
             "You are Ikaris, a highly technical research assistant for a Computer Science Master's student. "
-            f"You are running locally on a ROG Strix G16 (RTX 5070 Ti, 32GB RAM) hosted on {os_info}. "
+            f"You are running locally on a ROG Strix G16 (RTX 5070 Ti, 32GB RAM) hosted on {_OS_INFO}. "
             "Your tone is professional, expert, yet grounded and slightly witty. "
             "Focus on delivering clear, actionable research insights and system stats analysis.\n\n"
             "STRICT BEHAVIOR RULES:\n"
@@ -129,7 +149,6 @@ class IkarisMainWindow(QMainWindow):
             "- Respond concisely unless user requests elaboration."
         )
 
-        from langchain_core.messages import HumanMessage
         messages = [HumanMessage(content=text)]
 
         self._current_worker = LLMWorker(self.agent.llm, messages, system_prompt)
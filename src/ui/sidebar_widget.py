@@ -7,6 +7,10 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt
 from src.workspaces.workspace_manager import WorkspaceManager
+from src.tools.paper_tool import is_pdf
+
+# Display names: underscores → spaces in one C-level pass
+_UNDERSCORE_TRANS = str.maketrans("_", " ")
 
 
 class SidebarWidget(QWidget):
@@ -20,6 +24,11 @@ class SidebarWidget(QWidget):
         self.setFixedWidth(260)
         self.setAcceptDrops(True)
         self.wm = WorkspaceManager()
+        # Sorted PDF basenames, rescanned on workspace change, after an import,
+        # or when the folder's mtime shows a change made outside the app
+        self._papers = []
+        self._papers_key = None  # (workspace, papers dir st_mtime_ns)
+        self._shown = None       # Names the list widget currently displays
         self._setup_ui()
         self.refresh_workspaces()
         self.refresh_papers()
@@ -53,6 +62,8 @@ class SidebarWidget(QWidget):
         layout.addWidget(section)
 
         self.paper_list = QListWidget()
+        # One-line rows: lets the view lay out by the first row instead of measuring each
+        self.paper_list.setUniformItemSizes(True)
         layout.addWidget(self.paper_list)
 
         # Index section
@@ -106,29 +117,48 @@ class SidebarWidget(QWidget):
             self.refresh_workspaces()
             self.refresh_papers()
 
+    def _sync_papers(self, papers_path):
+        """Rebuild the sorted PDF cache from disk for the active workspace."""
+        with os.scandir(papers_path) as it:
+            # is_file() uses the type scandir already read; no extra stat per entry
+            self._papers = sorted(e.name for e in it if is_pdf(e.name) and e.is_file())
+
     def refresh_papers(self):
-        """Scan the active workspace papers directory and populate the list."""
-        self.paper_list.clear()
+        """Populate the list from the cached paper names, rescanning when the folder changes."""
         papers_path = self.wm.get_papers_dir()
         
         if not os.path.exists(papers_path):
             os.makedirs(papers_path, exist_ok=True)
 
-        pdf_files = sorted([f for f in os.listdir(papers_path) if f.endswith('.pdf')])
+        key = (self.wm.get_active_workspace(), os.stat(papers_path).st_mtime_ns)
+        if key != self._papers_key:
+            self._sync_papers(papers_path)
+            self._papers_key = key
+        pdf_files = self._papers
+
+        # Same names already on screen: skip the clear and repaint
+        if pdf_files == self._shown:
+            return
+        self._shown = list(pdf_files)
+        self.paper_list.clear()
         
         if not pdf_files:
             item = QListWidgetItem("No papers yet. Click 'Add PDFs'.")
             item.setFlags(item.flags() & ~Qt.ItemIsSelectable)
             self.paper_list.addItem(item)
         else:
+            # Items carry tooltips, so they can't go through addItems(list[str]);
+            # suspend painting instead so the view repaints once, not per row
+            self.paper_list.setUpdatesEnabled(False)
             for pdf in pdf_files:
-                # Clean display name
-                display = pdf.replace("_", " ").replace(".pdf", "")
+                # Clean display name (every entry carries a 4-char .pdf suffix, any case)
+                display = pdf[:-4].translate(_UNDERSCORE_TRANS)
                 if len(display) > 35:
                     display = display[:32] + "..."
                 item = QListWidgetItem(f"📄 {display}")
                 item.setToolTip(pdf)
                 self.paper_list.addItem(item)
+            self.paper_list.setUpdatesEnabled(True)
 
     def _on_add_pdfs(self):
         """Open file dialog to add PDFs to the active workspace."""
@@ -145,7 +175,7 @@ class SidebarWidget(QWidget):
             event.ignore()
 
     def dropEvent(self, event):
-        files = [u.toLocalFile() for u in event.mimeData().urls() if u.toLocalFile().lower().endswith('.pdf')]
+        files = [p for u in event.mimeData().urls() if is_pdf(p := u.toLocalFile())]
         if files:
             self._import_pdfs(files)
 
@@ -160,6 +190,10 @@ class SidebarWidget(QWidget):
                 added_count += 1
         
         if added_count > 0:
+            # Rescan regardless of mtime: on coarse-mtime filesystems (FAT/exFAT
+            # 2 s, HFS+ 1 s) a copy in the same tick as the last scan doesn't
+            # change the folder stamp
+            self._papers_key = None
             self.set_status(f"Added {added_count} new PDF(s).")
             self.refresh_papers()
         else:
@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel
 from PyQt5.QtCore import QTimer
-from src.utils.helpers import get_system_health
+from src.utils.helpers import get_system_health_cached
 
 
 class StatusBarWidget(QWidget):
@@ -9,6 +9,16 @@ class StatusBarWidget(QWidget):
     Auto-refreshes every 5 seconds.
     """
 
+    # (attribute, format string over the health dict)
+    _FIELDS = (
+        ("status_label", "Status: {status}"),
+        ("vram_label", "VRAM: {vram_used}/{vram_total} MB"),
+        ("ram_label", "RAM: {ram_percent}%"),
+        ("gpu_label", "GPU: {gpu_util}"),
+    )
+    _DEFAULTS = {"status": "Unknown", "vram_used": 0, "vram_total": 0,
+                 "ram_percent": 0, "gpu_util": "N/A"}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("statusBar")
@@ -21,23 +31,16 @@ class StatusBarWidget(QWidget):
         layout.setContentsMargins(12, 0, 12, 0)
         layout.setSpacing(20)
 
-        self.status_label = QLabel("Initializing...")
-        self.status_label.setObjectName("statusLabel")
-        layout.addWidget(self.status_label)
-
-        layout.addStretch()
-
-        self.vram_label = QLabel("")
-        self.vram_label.setObjectName("statusLabel")
-        layout.addWidget(self.vram_label)
-
-        self.ram_label = QLabel("")
-        self.ram_label.setObjectName("statusLabel")
-        layout.addWidget(self.ram_label)
-
-        self.gpu_label = QLabel("")
-        self.gpu_label.setObjectName("statusLabel")
-        layout.addWidget(self.gpu_label)
+        labels = []
+        for i, (attr, _) in enumerate(self._FIELDS):
+            label = QLabel("Initializing..." if i == 0 else "")
+            label.setObjectName("statusLabel")
+            layout.addWidget(label)
+            if i == 0:
+                layout.addStretch()
+            setattr(self, attr, label)
+            labels.append(label)
+        self._labels = tuple(labels)
 
     def _start_polling(self):
         self._update_stats()
@@ -47,26 +50,17 @@ class StatusBarWidget(QWidget):
 
     def _update_stats(self):
         try:
-            health = get_system_health()
-            status_text = health.get("status", "Unknown")
-            self.status_label.setText(f"Status: {status_text}")
-            
-            vram_used = health.get("vram_used", 0)
-            vram_total = health.get("vram_total", 0)
-            self.vram_label.setText(f"VRAM: {vram_used}/{vram_total} MB")
-            
-            ram_pct = health.get("ram_percent", 0)
-            self.ram_label.setText(f"RAM: {ram_pct}%")
-            
-            gpu_util = health.get("gpu_util", "N/A")
-            self.gpu_label.setText(f"GPU: {gpu_util}")
-            
-            # Color coding
-            if vram_used > 10000:
-                self.vram_label.setObjectName("statusLabelWarn")
-            else:
-                self.vram_label.setObjectName("statusLabelGood")
-            self.vram_label.style().unpolish(self.vram_label)
-            self.vram_label.style().polish(self.vram_label)
+            health = {**self._DEFAULTS, **get_system_health_cached()}
+            for label, (_, fmt) in zip(self._labels, self._FIELDS):
+                text = fmt.format_map(health)
+                if label.text() != text:
+                    label.setText(text)
+
+            # Color coding (re-polish only when the style actually flips)
+            name = "statusLabelWarn" if health["vram_used"] > 10000 else "statusLabelGood"
+            if self.vram_label.objectName() != name:
+                self.vram_label.setObjectName(name)
+                self.vram_label.style().unpolish(self.vram_label)
+                self.vram_label.style().polish(self.vram_label)
         except Exception:
             self.status_label.setText("Status: ❌ Monitor Error")
@@ -1,14 +1,18 @@
 import os
+import threading
 from PyQt5.QtCore import QThread, pyqtSignal
 from src.utils.llm_client import stream_lm_studio
-from src.tools.paper_tool import ingest_papers
+from src.tools.paper_tool import ingest_papers, get_embeddings, is_pdf
 from langchain_core.messages import SystemMessage, HumanMessage
 
+# Streamed tokens are coalesced to at most one UI update per frame (~60 Hz)
+_TOKEN_FLUSH_S = 0.016
+
 
 class LLMWorker(QThread):
     """
     Runs LLM streaming in a background thread.
-    Emits tokens one at a time for real-time display.
+    Emits tokens in small per-frame batches for real-time display.
     """
     token_received = pyqtSignal(str)
     finished_signal = pyqtSignal()
@@ -21,12 +25,42 @@ class LLMWorker(QThread):
         self.system_prompt = system_prompt
 
     def run(self):
+        # Each emit is a queued cross-thread event; batching keeps fast models
+        # from flooding the UI event loop with one wakeup per token. A separate
+        # flusher thread drains the buffer every frame, so tokens never sit
+        # unshown while the stream blocks (slow reasoning, tool latency).
+        buf = []
+        lock = threading.Lock()
+        done = threading.Event()
+
+        def flush():
+            with lock:  # Emit under the lock so batches stay in order
+                if buf:
+                    self.token_received.emit("".join(buf))
+                    buf.clear()
+
+        def flusher():
+            while not done.wait(_TOKEN_FLUSH_S):
+                flush()
+
+        flush_thread = threading.Thread(target=flusher, name="llm-token-flush", daemon=True)
+        flush_thread.start()
+        error = None
         try:
             for token in stream_lm_studio(self.llm, self.messages, self.system_prompt):
-                self.token_received.emit(token)
-            self.finished_signal.emit()
+                with lock:
+                    buf.append(token)
         except Exception as e:
-            self.error_signal.emit(str(e))
+            error = e
+        finally:
+            done.set()
+            flush_thread.join()
+            flush()  # Whatever streamed last (or before a failure)
+
+        if error is None:
+            self.finished_signal.emit()
+        else:
+            self.error_signal.emit(str(error))
 
 
 class GraphWorker(QThread):
@@ -90,7 +124,7 @@ class IndexWorker(QThread):
                 self.finished_signal.emit("Created 'papers' folder. Add PDFs and try again.")
                 return
 
-            pdf_files = [f for f in os.listdir(papers_path) if f.endswith('.pdf')]
+            pdf_files = [f for f in os.listdir(papers_path) if is_pdf(f)]
             if not pdf_files:
                 self.finished_signal.emit("No PDFs found in the 'papers' folder.")
                 return
@@ -102,6 +136,19 @@ class IndexWorker(QThread):
             self.error_signal.emit(f"Indexing error: {str(e)}")
 
 
+class WarmupWorker(QThread):
+    """
+    Loads the MiniLM embedder and runs one encode in the background at startup,
+    so the first paper query doesn't pay for model init on top of its search.
+    """
+
+    def run(self):
+        try:
+            get_embeddings().embed_query("warmup")
+        except Exception:
+            pass  # Non-fatal: the first query loads the model and reports any error
+
+
 class VoiceWorker(QThread):
     """
     Runs STT listening in a background thread.
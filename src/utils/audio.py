@@ -20,8 +20,12 @@ Usage via Hydra:
 """
 
 import os
+import math
 import time
+import queue
 import logging
+import collections
+import functools
 import threading
 import numpy as np
 from dataclasses import dataclass, field
@@ -29,9 +33,31 @@ from typing import Callable, Optional
 
 log = logging.getLogger(__name__)
 
+# Silero VAD v5 native window (32 ms @ 16 kHz); mic blocks are aligned to it so
+# each callback is exactly one VAD inference instead of ~3 per 100 ms block
+_VAD_WINDOW = 512
+
+# int16 PCM → float32 [-1, 1) scale; mic is captured as int16 to halve bytes moved
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# Hard cap on one captured utterance; bounds the capture ring's memory
+_MAX_UTTERANCE_S = 30
+
+
+def _capture_size(fs: int) -> int:
+    """
+    Ring capacity for one utterance at `fs`. Headroom of 100 ms + one block
+    covers blocks delivered between the cap firing and the stream closing, so
+    a capture never wraps and is read back as a zero-copy view.
+    """
+    return fs * _MAX_UTTERANCE_S + int(fs * 0.1) + _VAD_WINDOW
+
 # ---------------------------------------------------------------------------
-# Lazy imports — these are heavy; only load when actually needed
+# Lazy imports — these are heavy; only load when actually needed.
+# Cached so hot paths (listen/speak) skip the try/except and a missing
+# package is only warned about once per run.
 # ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
 def _import_sherpa():
     try:
         import sherpa_onnx
@@ -40,6 +66,7 @@ def _import_sherpa():
         log.warning("[Audio] sherpa-onnx not installed. STT/TTS unavailable.")
         return None
 
+@functools.lru_cache(maxsize=None)
 def _import_sounddevice():
     try:
         import sounddevice as sd
@@ -49,6 +76,77 @@ def _import_sounddevice():
         return None
 
 
+def _default_num_threads() -> int:
+    """ORT intra-op threads when not configured: half the logical cores, max 4."""
+    return max(1, min((os.cpu_count() or 2) // 2, 4))
+
+
+@functools.lru_cache(maxsize=None)
+def _cpu_has_vnni() -> bool:
+    """
+    True if the CPU advertises VNNI (avx512_vnni / avx_vnni). Dynamic INT8
+    ONNX kernels only beat FP32 with VNNI; without it weight-only INT8 wins.
+    """
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return "avx512_vnni" in line or "avx_vnni" in line
+    except OSError:
+        pass
+    return False  # Unknown (non-Linux) — assume no VNNI
+
+
+# ---------------------------------------------------------------------------
+# Energy VAD — fallback gate when Silero is unavailable
+# ---------------------------------------------------------------------------
+def _energy_vad_numpy(samples: np.ndarray, threshold_sq: float) -> bool:
+    # mean(x²) >= thr²  ⇔  sum(x²) >= thr²·n — no sqrt, no division
+    return float(np.dot(samples, samples)) >= threshold_sq * samples.size
+
+
+@functools.lru_cache(maxsize=None)
+def _get_energy_vad():
+    """
+    Return the fused energy + threshold kernel `(samples, threshold_sq) -> is_speech`,
+    compared in the squared-RMS domain. Numba-compiled when numba is installed
+    (optional), else NumPy. Resolved and warmed up before the mic opens so JIT
+    time never lands in the audio callback.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _energy_vad_numpy
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _energy_vad(samples, threshold_sq):
+        s = 0.0
+        for i in range(samples.size):
+            s += samples[i] * samples[i]
+        return s >= threshold_sq * samples.size
+
+    try:
+        _energy_vad(np.zeros(_VAD_WINDOW, dtype=np.float32), 1e-4)
+    except Exception as e:
+        log.warning(f"[Audio] Numba energy VAD unavailable, using NumPy: {e}")
+        return _energy_vad_numpy
+    return _energy_vad
+
+
+# ---------------------------------------------------------------------------
+# TTS sample hand-off
+# ---------------------------------------------------------------------------
+def _as_float32(samples) -> np.ndarray:
+    """
+    sherpa-onnx audio samples as float32. The TTS callback hands over its own
+    float32 array (wrapped zero-copy); older bindings return a list, which is
+    unboxed with fromiter instead of building an intermediate object array.
+    """
+    if isinstance(samples, list):
+        return np.fromiter(samples, dtype=np.float32, count=len(samples))
+    return np.asarray(samples, dtype=np.float32)
+
+
 # ---------------------------------------------------------------------------
 # STT Result — carries transcription + confidence
 # ---------------------------------------------------------------------------
@@ -62,6 +160,117 @@ class STTResult:
     is_fallback: bool = False   # True if auto-switched to CPU fallback
 
 
+# ---------------------------------------------------------------------------
+# Listener parameters — per-(fs, silence) constants, computed once
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True)
+class _ListenerParams:
+    chunk_size: int          # samples per mic block (one VAD window)
+    silence_chunks: int      # trailing silent blocks that end an utterance
+    ring_size: int           # capture ring capacity
+    decode_batch: int        # samples coalesced per accept_waveform
+    tail_pad: np.ndarray     # read-only 0.5 s silence to flush the decoder
+
+
+@functools.lru_cache(maxsize=8)
+def _listener_params(fs: int, silence_duration: float) -> _ListenerParams:
+    tail_pad = np.zeros(int(fs * 0.5), dtype=np.float32)
+    tail_pad.setflags(write=False)
+    return _ListenerParams(
+        chunk_size=_VAD_WINDOW,
+        silence_chunks=math.ceil(silence_duration * fs / _VAD_WINDOW),
+        ring_size=_capture_size(fs),
+        decode_batch=int(fs * 0.1),
+        tail_pad=tail_pad,
+    )
+
+
+# Heuristic confidence by whole chars-per-token (index, clipped to the last
+# entry). Well-formed speech has ~2-8 chars/token; entries are pre-clamped
+_CONF_BY_CHARS_PER_TOKEN = (0.40, 0.65) + (0.85,) * 7 + (0.65,) * 4 + (0.40,)
+
+
+def _put_sentinel(q: queue.Queue, worker: threading.Thread):
+    """Queue the end-of-stream None for `worker`, giving up if it has exited."""
+    while worker.is_alive():
+        try:
+            q.put(None, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def _drain(q: queue.Queue):
+    """Discard everything still queued."""
+    try:
+        while True:
+            q.get_nowait()
+    except queue.Empty:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Partial hypothesis batching — coalesces per-token callbacks
+# ---------------------------------------------------------------------------
+class _BatchedCallback:
+    """
+    Wraps the user partial callback so it fires at most once per `interval_s`
+    (or every `max_pending` updates) instead of once per decoded token.
+    Partials are cumulative, so only the newest text needs delivering. A held
+    update is delivered by a deadline timer once the interval is up, so the
+    newest words show even when the hypothesis stops changing (speech pause).
+    """
+    __slots__ = ("_fn", "_interval", "_max_pending", "_pending", "_count",
+                 "_last_emit", "_lock", "_timer")
+
+    def __init__(self, fn: Callable[[str], None], interval_s: float = 0.05,
+                 max_pending: int = 8):
+        self._fn = fn
+        self._interval = interval_s
+        self._max_pending = max_pending
+        self._pending = None
+        self._count = 0
+        self._last_emit = 0.0
+        # Delivery runs under the lock so the timer and callers can't reorder texts
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def __call__(self, text: str):
+        with self._lock:
+            self._pending = text
+            self._count += 1
+            now = time.monotonic()
+            if self._count < self._max_pending and now - self._last_emit < self._interval:
+                if self._timer is None:
+                    self._timer = threading.Timer(self._interval - (now - self._last_emit),
+                                                  self._deliver_due)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+            self._deliver(now)
+
+    def _deliver(self, now: float):
+        """Hand the held text to the user callback. Caller holds the lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        text, self._pending, self._count, self._last_emit = self._pending, None, 0, now
+        if text is not None:
+            self._fn(text)
+
+    def _deliver_due(self):
+        """Deadline timer: the interval passed with an update still held."""
+        with self._lock:
+            self._timer = None
+            if self._pending is not None:
+                self._deliver(time.monotonic())
+
+    def flush(self):
+        """Deliver any update still held back (end of utterance)."""
+        with self._lock:
+            self._deliver(self._last_emit)
+
+
 # ===================================================================
 # SherpaAudioStack — the main class Hydra instantiates
 # ===================================================================
@@ -86,6 +295,11 @@ class SherpaAudioStack:
         self.stt_cfg = stt or {}
         self.tts_cfg = tts or {}
         self.config = kwargs
+        # Resolved once; picks the STT engine and the streaming/offline path
+        self._stt_type = self.stt_cfg.get("type", "whisper")
+        # ORT intra-op threads (`num_threads` in the stt/tts config sections)
+        self._stt_threads = self.stt_cfg.get("num_threads") or _default_num_threads()
+        self._tts_threads = self.tts_cfg.get("num_threads") or _default_num_threads()
 
         # Lazy-loaded engines
         self._recognizer = None
@@ -96,20 +310,52 @@ class SherpaAudioStack:
         # CPU fallback recognizer (auto-switch feature)
         self._fallback_recognizer = None
         self._fallback_loaded = False
+        self._fallback_streaming = False  # True if the fallback is streaming Zipformer
 
-        # Partial hypothesis callback: fn(partial_text: str)
-        self._partial_callback: Optional[Callable[[str], None]] = None
+        # Partial hypothesis callback: fn(partial_text: str), batched
+        self._partial_callback: Optional[_BatchedCallback] = None
         self._is_listening = False # Added
+        # Set by the mic callback at end-of-utterance or by stop_listening()
+        self._end_event = threading.Event()
 
-        # Thread safety for VAD state
+        # Guards VAD reset(); the mic callback is the only VAD producer
         self._lock = threading.Lock()
 
+        # Preallocated capture ring (30s @ 16kHz + headroom) — avoids per-chunk list/concat copies
+        self._ring = np.zeros(_capture_size(16000), dtype=np.float32)
+        self._ring_head = 0
+        self._ring_count = 0
+
+        # Speech blocks (ring views) handed from the mic callback to the decode worker
+        self._audio_q: queue.Queue = queue.Queue(maxsize=64)
+
+        # Engine loads take seconds; warm them up in the background so the
+        # first listen()/speak() only waits for whatever is still loading
+        self._stt_init_lock = threading.Lock()
+        self._tts_init_lock = threading.Lock()
+        if self.has_stt or self.has_tts:
+            threading.Thread(target=self._warm_up, name="audio-warmup", daemon=True).start()
+
         log.info(f"[Audio] SherpaAudioStack v2 initialized | provider={provider} device={device}")
         log.info(f"[Audio] STT: {self.stt_cfg.get('type', 'none')} | TTS: {self.tts_cfg.get('type', 'none')}")
 
+    def _warm_up(self):
+        """Background preload of STT (+VAD) and TTS engines."""
+        try:
+            if self.has_stt:
+                with self._stt_init_lock:
+                    self._init_stt()
+                    self._init_vad()
+            if self.has_tts:
+                with self._tts_init_lock:
+                    self._init_tts()
+        except Exception as e:
+            log.error(f"[Audio] Engine warm-up failed: {e}")
+
     def stop_listening(self):
         """Immediately interrupt any active listen loop (e.g., Push-to-Talk release)."""
         self._is_listening = False
+        self._end_event.set()
 
     # ------------------------------------------------------------------
     # Public: set partial hypothesis callback
@@ -119,12 +365,69 @@ class SherpaAudioStack:
         Set a callback that receives partial transcription text
         as Zipformer streaming produces tokens in real-time.
 
+        Updates are coalesced (>=50ms or 8 tokens apart) so a Qt signal
+        emit does not re-enter the interpreter for every decoded token.
+
         Example:
             audio.set_partial_callback(lambda text: print(f"... {text}"))
         """
-        self._partial_callback = callback
+        self._partial_callback = _BatchedCallback(callback) if callback is not None else None
         log.info("[Audio] Partial hypothesis callback registered.")
 
+    # ------------------------------------------------------------------
+    # Ring buffer: preallocated mic capture storage
+    # ------------------------------------------------------------------
+    def _ring_reset(self, size: int):
+        """Rewind the capture ring, growing it only if `size` exceeds capacity."""
+        if len(self._ring) < size:
+            self._ring = np.zeros(size, dtype=np.float32)
+        self._ring_head = 0
+        self._ring_count = 0
+
+    def _ring_write(self, chunk: np.ndarray) -> np.ndarray:
+        """
+        Convert int16 PCM `chunk` to float32 directly into the ring at the
+        write head (wrapping by modulo). Returns a view of the written region so VAD can consume it without
+        another copy; only a wrapped write has to be stitched together.
+        """
+        cap = len(self._ring)
+        n = len(chunk)
+        start = self._ring_head % cap
+        end = start + n
+        self._ring_head += n
+        self._ring_count = min(self._ring_count + n, cap)
+        if end <= cap:
+            np.multiply(chunk, _INT16_SCALE, out=self._ring[start:end])
+            return self._ring[start:end]
+        split = cap - start
+        np.multiply(chunk[:split], _INT16_SCALE, out=self._ring[start:])
+        np.multiply(chunk[split:], _INT16_SCALE, out=self._ring[:n - split])
+        return np.concatenate((self._ring[start:], self._ring[:n - split]))
+
+    def _ring_discard(self, n: int):
+        """Roll back the last `n` written samples (e.g. VAD-rejected silence)."""
+        n = min(n, self._ring_count)
+        self._ring_head -= n
+        self._ring_count -= n
+
+    def _ring_read(self) -> np.ndarray:
+        """Return captured audio oldest-first; a zero-copy view unless wrapped."""
+        cap = len(self._ring)
+        start = (self._ring_head - self._ring_count) % cap
+        end = start + self._ring_count
+        if end <= cap:
+            return self._ring[start:end]
+        return np.concatenate((self._ring[start:], self._ring[:end - cap]))
+
+    # ------------------------------------------------------------------
+    # Shared sherpa-onnx module handle
+    # ------------------------------------------------------------------
+    def _get_sherpa(self):
+        """Bind the sherpa-onnx module once; every _init_* goes through here."""
+        if self._sherpa is None:
+            self._sherpa = _import_sherpa()
+        return self._sherpa
+
     # ------------------------------------------------------------------
     # VAD: Silero Voice Activity Detection
     # ------------------------------------------------------------------
@@ -133,10 +436,9 @@ class SherpaAudioStack:
         if self._vad is not None:
             return True
 
-        sherpa = _import_sherpa()
+        sherpa = self._get_sherpa()
         if sherpa is None:
             return False
-        self._sherpa = sherpa
 
         vad_model = os.path.join("models", "vad", "silero_vad.onnx")
         if not os.path.exists(vad_model):
@@ -144,21 +446,28 @@ class SherpaAudioStack:
                         "VAD disabled — will record without speech gating.")
             return False
 
-        try:
-            vad_config = sherpa.VadModelConfig()
-            vad_config.silero_vad.model = vad_model
-            vad_config.silero_vad.threshold = 0.5
-            vad_config.silero_vad.min_silence_duration = 0.5   # seconds
-            vad_config.silero_vad.min_speech_duration = 0.25   # seconds
-            vad_config.sample_rate = 16000
-
-            self._vad = sherpa.VoiceActivityDetector(vad_config, buffer_size_in_seconds=30)
-            log.info("[Audio] Silero VAD loaded — speech gating active.")
-            return True
-        except Exception as e:
-            log.error(f"[Audio] Failed to load Silero VAD: {e}")
-            self._vad = None
-            return False
+        # On OpenVINO, colocate VAD with STT (e.g. on the NPU) so the per-block
+        # inference doesn't compete with decode threads for CPU. Elsewhere
+        # (notably CUDA) a ~2 MB model every 32 ms is cheaper on CPU than a GPU
+        # round-trip. CPU is always the safety net.
+        providers = ["openvino", "cpu"] if self.provider == "openvino" else ["cpu"]
+        for provider in providers:
+            try:
+                vad_config = sherpa.VadModelConfig()
+                vad_config.silero_vad.model = vad_model
+                vad_config.silero_vad.threshold = 0.5
+                vad_config.silero_vad.min_silence_duration = 0.5   # seconds
+                vad_config.silero_vad.min_speech_duration = 0.25   # seconds
+                vad_config.sample_rate = 16000
+                vad_config.provider = provider
+
+                self._vad = sherpa.VoiceActivityDetector(vad_config, buffer_size_in_seconds=30)
+                log.info(f"[Audio] Silero VAD loaded on {provider} — speech gating active.")
+                return True
+            except Exception as e:
+                log.error(f"[Audio] Failed to load Silero VAD ({provider}): {e}")
+                self._vad = None
+        return False
 
     # ------------------------------------------------------------------
     # STT: Speech-to-Text
@@ -168,12 +477,11 @@ class SherpaAudioStack:
         if self._recognizer is not None:
             return True
 
-        sherpa = _import_sherpa()
+        sherpa = self._get_sherpa()
         if sherpa is None:
             return False
-        self._sherpa = sherpa
 
-        stt_type = self.stt_cfg.get("type", "whisper")
+        stt_type = self._stt_type
         model_path = self.stt_cfg.get("model_path", "")
         tokens = self.stt_cfg.get("tokens", "")
 
@@ -193,9 +501,11 @@ class SherpaAudioStack:
                     joiner=model_path.replace(".onnx", "-joiner.onnx"),
                     tokens=tokens,
                     provider=self.provider,
-                    num_threads=2,
+                    num_threads=self._stt_threads,
                     sample_rate=16000,
                     feature_dim=80,
+                    # Explicit type skips sherpa's metadata probing at load
+                    model_type=self.stt_cfg.get("model_type", ""),
                 )
             else:
                 self._recognizer = sherpa.OfflineRecognizer.from_whisper(
@@ -203,7 +513,7 @@ class SherpaAudioStack:
                     decoder=model_path.replace(".onnx", "-decoder.onnx"),
                     tokens=tokens,
                     provider=self.provider,
-                    num_threads=4,
+                    num_threads=self._stt_threads,
                 )
         except Exception as e:
             log.error(f"[Audio] Failed to load primary STT ({self.provider}): {e}")
@@ -216,8 +526,9 @@ class SherpaAudioStack:
 
     def _init_fallback_stt(self):
         """
-        Auto-switch: load CPU Whisper INT8 as fallback when primary STT fails.
-        Only triggers if the primary provider is NOT already CPU.
+        Auto-switch: load a CPU fallback when primary STT fails. Prefers
+        streaming Zipformer INT8 (keeps partial hypotheses), then CPU Whisper
+        INT8. Only triggers if the primary provider is NOT already CPU.
         """
         if self._fallback_loaded:
             return self._fallback_recognizer is not None
@@ -227,21 +538,24 @@ class SherpaAudioStack:
             self._fallback_loaded = True
             return False
 
-        sherpa = self._sherpa
+        sherpa = self._get_sherpa()
         if sherpa is None:
             self._fallback_loaded = True
             return False
 
-        fallback_encoder = os.path.join("models", "stt", "whisper-base-int8-encoder.onnx")
-        fallback_decoder = os.path.join("models", "stt", "whisper-base-int8-decoder.onnx")
+        if self._init_fallback_streaming_stt(sherpa):
+            return True
+
+        fallback_encoder, fallback_decoder = self._fallback_whisper_paths()
         fallback_tokens = os.path.join("models", "stt", "tokens.txt")
 
-        if not os.path.exists(fallback_encoder):
+        if fallback_encoder is None:
             log.warning("[Audio] CPU fallback models not found. Auto-switch unavailable.")
             self._fallback_loaded = True
             return False
 
-        log.info("[Audio] ⚡ Auto-switching to CPU Whisper INT8 fallback...")
+        log.info(f"[Audio] ⚡ Auto-switching to CPU Whisper INT8 fallback "
+                 f"({os.path.basename(fallback_encoder)})...")
         start = time.time()
 
         try:
@@ -250,7 +564,7 @@ class SherpaAudioStack:
                 decoder=fallback_decoder,
                 tokens=fallback_tokens,
                 provider="cpu",
-                num_threads=4,
+                num_threads=self._stt_threads,
             )
             self._fallback_loaded = True
             log.info(f"[Audio] CPU fallback STT loaded in {time.time() - start:.2f}s")
@@ -261,13 +575,71 @@ class SherpaAudioStack:
             self._fallback_recognizer = None
             return False
 
+    def _init_fallback_streaming_stt(self, sherpa) -> bool:
+        """Try the streaming Zipformer INT8 fallback; False if absent or broken."""
+        prefix = os.path.join("models", "stt", "zipformer-int8")
+        if not os.path.exists(f"{prefix}-encoder.onnx"):
+            return False
+
+        log.info("[Audio] ⚡ Auto-switching to CPU streaming Zipformer INT8 fallback...")
+        start = time.time()
+
+        try:
+            self._fallback_recognizer = sherpa.OnlineRecognizer.from_transducer(
+                encoder=f"{prefix}-encoder.onnx",
+                decoder=f"{prefix}-decoder.onnx",
+                joiner=f"{prefix}-joiner.onnx",
+                tokens=os.path.join("models", "stt", "zipformer-tokens.txt"),
+                provider="cpu",
+                num_threads=self._stt_threads,
+                sample_rate=16000,
+                feature_dim=80,
+                model_type="zipformer",
+            )
+        except Exception as e:
+            log.error(f"[Audio] Streaming Zipformer fallback failed: {e}")
+            self._fallback_recognizer = None
+            return False
+
+        self._fallback_loaded = True
+        self._fallback_streaming = True
+        log.info(f"[Audio] CPU fallback STT loaded in {time.time() - start:.2f}s")
+        return True
+
+    def _fallback_whisper_paths(self):
+        """
+        Pick the CPU Whisper fallback artifact (encoder, decoder) per
+        `stt.fallback_quant`:
+          - "w8a16"    : weight-only INT8 (MatMulNBits), fast without VNNI
+          - "dyn_int8" : dynamic QUInt8, fast only with VNNI
+          - "auto"     : dyn_int8 if the CPU has VNNI, else w8a16 (default)
+        Falls back to whichever variant exists on disk; (None, None) if neither.
+        """
+        variants = {
+            "w8a16": "whisper-base-w8a16",
+            "dyn_int8": "whisper-base-int8",
+        }
+        quant = self.stt_cfg.get("fallback_quant", "auto")
+        if quant not in variants:
+            quant = "dyn_int8" if _cpu_has_vnni() else "w8a16"
+
+        for name in (variants[quant], *(v for k, v in variants.items() if k != quant)):
+            encoder = os.path.join("models", "stt", f"{name}-encoder.onnx")
+            if os.path.exists(encoder):
+                return encoder, os.path.join("models", "stt", f"{name}-decoder.onnx")
+        return None, None
+
     def _get_active_recognizer(self):
-        """Return the active recognizer (primary or fallback)."""
+        """
+        Return (recognizer, provider, is_fallback, streaming) for the active
+        recognizer (primary or fallback).
+        """
         if self._recognizer is not None:
-            return self._recognizer, self.provider, False
+            streaming = self._stt_type == "zipformer_streaming"
+            return self._recognizer, self.provider, False, streaming
         if self._fallback_recognizer is not None:
-            return self._fallback_recognizer, "cpu", True
-        return None, None, False
+            return self._fallback_recognizer, "cpu", True, self._fallback_streaming
+        return None, None, False, False
 
     # ------------------------------------------------------------------
     # Main listen() entry point
@@ -288,22 +660,22 @@ class SherpaAudioStack:
         if sd is None:
             return STTResult(text="Error: sounddevice not available.")
 
-        stt_ready = self._init_stt()
+        # Waits here if the warm-up thread is still loading the engines
+        with self._stt_init_lock:
+            stt_ready = self._init_stt()
+            # Initialize VAD (optional — degrades gracefully)
+            vad_active = stt_ready and self._init_vad()
         if not stt_ready:
             return self._fallback_listen()
 
-        # Initialize VAD (optional — degrades gracefully)
-        vad_active = self._init_vad()
-
-        stt_type = self.stt_cfg.get("type", "whisper")
-        recognizer, provider, is_fallback = self._get_active_recognizer()
+        recognizer, provider, is_fallback, streaming = self._get_active_recognizer()
 
         if recognizer is None:
             return self._fallback_listen()
 
-        if stt_type == "zipformer_streaming" and not is_fallback:
+        if streaming:
             return self._listen_streaming_vad(sd, fs, silence_threshold, silence_duration,
-                                              recognizer, provider, vad_active)
+                                              recognizer, provider, is_fallback, vad_active)
         else:
             return self._listen_offline_vad(sd, fs, silence_threshold, silence_duration,
                                             recognizer, provider, is_fallback, vad_active)
@@ -312,38 +684,52 @@ class SherpaAudioStack:
     # Streaming STT with VAD + partial hypothesis
     # ------------------------------------------------------------------
     def _listen_streaming_vad(self, sd, fs, silence_threshold, silence_duration,
-                              recognizer, provider, vad_active) -> STTResult:
+                              recognizer, provider, is_fallback, vad_active) -> STTResult:
         """
         Streaming Zipformer recognition with:
         - Silero VAD gating (only process speech segments)
         - Partial hypothesis emission via callback
         - Confidence scoring
+
+        The PortAudio callback only runs VAD and enqueues speech blocks;
+        a dedicated worker thread owns all recognizer calls, so a slow
+        decode can never stall the audio thread into an underrun.
         """
         stream = recognizer.create_stream()
         recording_start = time.time()
         silent_chunks = 0
         speech_detected = False
-        chunk_size = int(fs * 0.1)  # 100ms chunks
+        params = _listener_params(fs, silence_duration)
+        chunk_size = params.chunk_size  # 32ms chunks
         last_partial = ""
-        max_duration = 30  # seconds safety cap
+        max_duration = _MAX_UTTERANCE_S  # seconds safety cap
+        # Queued blocks are views into the ring, which holds the whole utterance
+        self._ring_reset(params.ring_size)
+        # Resolve (and JIT) the energy gate now, never inside the callback
+        energy_vad = None if vad_active and self._vad is not None else _get_energy_vad()
+        threshold_sq = silence_threshold * silence_threshold
+        end_after = params.silence_chunks
+        end_event = self._end_event
+        end_event.clear()
 
         def callback(indata, frames, time_info, status):
-            nonlocal silent_chunks, speech_detected, last_partial
-            samples = indata.flatten().astype(np.float32)
-            volume = np.linalg.norm(indata) / np.sqrt(len(indata))
+            nonlocal silent_chunks, speech_detected
+            # Mono block → 1-D view (reshape, never flatten: no per-block copy)
+            samples = self._ring_write(indata.reshape(-1))
 
             # --- VAD gate ---
+            # VAD is single-producer from the PortAudio callback, so no lock here
             if vad_active and self._vad is not None:
-                with self._lock:
-                    self._vad.accept_waveform(samples)
-                    if self._vad.is_speech_detected():
-                        speech_detected = True
-                        silent_chunks = 0
-                    elif speech_detected:
-                        silent_chunks += 1
+                self._vad.accept_waveform(samples)
+                if self._vad.is_speech_detected():
+                    speech_detected = True
+                    silent_chunks = 0
+                elif speech_detected:
+                    silent_chunks += 1
             else:
-                # Fallback: simple energy-based VAD
-                if volume >= silence_threshold:
+                # Fallback: simple energy-based VAD (squared-RMS vs threshold², no sqrt)
+                is_speech = energy_vad(samples, threshold_sq)
+                if is_speech:
                     speech_detected = True
                     silent_chunks = 0
                 elif speech_detected:
@@ -351,52 +737,103 @@ class SherpaAudioStack:
 
             # Only feed audio to recognizer if speech is active
             if speech_detected:
-                stream.accept_waveform(fs, samples)
-
-            # --- Partial hypothesis ---
-            if speech_detected and self._partial_callback is not None:
+                try:
+                    self._audio_q.put_nowait(samples)
+                except queue.Full:
+                    log.warning("[Audio] Decode queue full — dropping a block.")
+                if silent_chunks >= end_after:
+                    end_event.set()
+            else:
+                self._ring_discard(len(samples))
+
+        # Coalesce ~100 ms of 32 ms VAD blocks per accept_waveform, so the
+        # pybind/FIFO copy is paid ~3x less often; Zipformer decodes in
+        # larger feature chunks anyway, so partial latency is unaffected
+        batch = params.decode_batch
+        pending = np.empty(batch + chunk_size, dtype=np.float32)
+
+        worker_error = []  # Exception raised in the decode thread, re-raised below
+
+        def decode_worker():
+            try:
+                decode_loop()
+            except Exception as e:
+                worker_error.append(e)
+                end_event.set()  # Stop recording now; nothing is decoding it
+
+        def decode_loop():
+            nonlocal last_partial
+            pending_n = 0
+            while True:
+                samples = self._audio_q.get()
+                if samples is not None:
+                    pending[pending_n:pending_n + len(samples)] = samples
+                    pending_n += len(samples)
+                    if pending_n < batch:
+                        continue
+                if pending_n:
+                    stream.accept_waveform(fs, pending[:pending_n])
+                    pending_n = 0
+                if samples is None:
+                    return  # Drained; the final decode runs after the join
+                decoded_any = False
                 while recognizer.is_ready(stream):
                     recognizer.decode_stream(stream)
-                res = recognizer.get_result(stream)
-                partial = res if isinstance(res, str) else res.text
-                partial = partial.strip()
-                if partial and partial != last_partial:
-                    last_partial = partial
-                    try:
-                        self._partial_callback(partial)
-                    except Exception:
-                        pass  # Don't crash on callback errors
+                    decoded_any = True
+
+                # --- Partial hypothesis (only when the decoder advanced) ---
+                if decoded_any and self._partial_callback is not None:
+                    res = recognizer.get_result(stream)
+                    partial = res if isinstance(res, str) else res.text
+                    partial = partial.strip()
+                    if partial and partial != last_partial:
+                        last_partial = partial
+                        try:
+                            self._partial_callback(partial)
+                        except Exception:
+                            pass  # Don't crash on callback errors
 
         log.info("[Audio] 🎤 Streaming STT (VAD-gated) — Listening...")
         self._is_listening = True
-        with sd.InputStream(samplerate=fs, channels=1, callback=callback,
-                            blocksize=chunk_size):
-            while self._is_listening: # Changed from while True:
-                time.sleep(0.1)
-
-                # Process any remaining frames
-                while recognizer.is_ready(stream):
-                    recognizer.decode_stream(stream)
-
-                # Exit conditions
-                elapsed = time.time() - recording_start
-                if speech_detected and silent_chunks >= (silence_duration / 0.1):
-                    break
-                if elapsed > max_duration:
-                    log.warning("[Audio] Safety timeout (30s) reached.")
-                    break
+        worker = threading.Thread(target=decode_worker, name="stt-decode", daemon=True)
+        worker.start()
+        try:
+            with sd.InputStream(samplerate=fs, channels=1, dtype="int16", latency="low",
+                                callback=callback, blocksize=chunk_size):
+                # Block until the callback signals end-of-utterance (or
+                # stop_listening); timeouts only cover the give-up cases
                 # If no speech after 10s, give up
-                if not speech_detected and elapsed > 10:
+                if not end_event.wait(timeout=10) and not speech_detected:
                     log.info("[Audio] No speech detected in 10s. Giving up.")
                     return STTResult(text="Error: No speech detected.",
                                     provider=provider)
+                remaining = max_duration - (time.time() - recording_start)
+                if not end_event.wait(timeout=max(0.0, remaining)):
+                    log.warning("[Audio] Safety timeout (30s) reached.")
+        finally:
+            # Drain: the worker decodes everything queued before the sentinel.
+            # A worker that died can't drain, so never block on a full queue
+            _put_sentinel(self._audio_q, worker)
+            worker.join()
+            _drain(self._audio_q)  # Leftovers from a dead worker
+
+        if worker_error:
+            if self._vad is not None:
+                with self._lock:
+                    self._vad.reset()
+            raise worker_error[0]  # listen() callers (VoiceWorker) report it
 
         # Finalize recognition
-        tail_padding = np.zeros(int(fs * 0.5), dtype=np.float32)
-        stream.accept_waveform(fs, tail_padding)
+        stream.accept_waveform(fs, params.tail_pad)
         while recognizer.is_ready(stream):
             recognizer.decode_stream(stream)
 
+        if self._partial_callback is not None:
+            try:
+                self._partial_callback.flush()
+            except Exception:
+                pass  # Don't crash on callback errors
+
         res = recognizer.get_result(stream)
         text = res if isinstance(res, str) else res.text
         text = text.strip()
@@ -408,7 +845,7 @@ class SherpaAudioStack:
         log.info(f"[Audio] Transcribed (streaming): '{text}' "
                  f"(confidence={confidence:.2f}, duration={duration:.1f}s)")
 
-        # Flush VAD state
+        # Flush VAD state; reset() may race with callback exit so we still lock it
         if self._vad is not None:
             with self._lock:
                 self._vad.reset()
@@ -418,7 +855,7 @@ class SherpaAudioStack:
             confidence=confidence,
             duration_s=duration,
             provider=provider,
-            is_fallback=False,
+            is_fallback=is_fallback,
         )
 
     # ------------------------------------------------------------------
@@ -430,58 +867,61 @@ class SherpaAudioStack:
         Record audio (VAD-gated), then batch-transcribe with offline Whisper.
         Extracts confidence from token probabilities.
         """
-        recording = []
         recording_start = time.time()
         silent_chunks = 0
         speech_detected = False
-        chunk_size = int(fs * 0.1)
-        max_duration = 30
+        params = _listener_params(fs, silence_duration)
+        chunk_size = params.chunk_size
+        max_duration = _MAX_UTTERANCE_S
+        self._ring_reset(params.ring_size)
+        # Resolve (and JIT) the energy gate now, never inside the callback
+        energy_vad = None if vad_active and self._vad is not None else _get_energy_vad()
+        threshold_sq = silence_threshold * silence_threshold
+        end_after = params.silence_chunks
+        end_event = self._end_event
+        end_event.clear()
 
         def callback(indata, frames, time_info, status):
             nonlocal silent_chunks, speech_detected
-            samples = indata.flatten().astype(np.float32)
-            volume = np.linalg.norm(indata) / np.sqrt(len(indata))
+            # Mono block → 1-D view (reshape, never flatten: no per-block copy)
+            samples = self._ring_write(indata.reshape(-1))
 
             # --- VAD gate ---
+            # VAD is single-producer from the PortAudio callback, so no lock here
             if vad_active and self._vad is not None:
-                with self._lock:
-                    self._vad.accept_waveform(samples)
-                    if self._vad.is_speech_detected():
-                        speech_detected = True
-                        silent_chunks = 0
-                        recording.append(indata.copy())
-                    elif speech_detected:
-                        silent_chunks += 1
-                        recording.append(indata.copy())  # keep tail audio
+                self._vad.accept_waveform(samples)
+                if self._vad.is_speech_detected():
+                    speech_detected = True
+                    silent_chunks = 0
+                elif speech_detected:
+                    silent_chunks += 1  # keep tail audio
+                else:
+                    self._ring_discard(len(samples))
             else:
-                recording.append(indata.copy())
-                if volume >= silence_threshold:
+                is_speech = energy_vad(samples, threshold_sq)
+                if is_speech:
                     speech_detected = True
                     silent_chunks = 0
                 elif speech_detected:
                     silent_chunks += 1
 
+            if speech_detected and silent_chunks >= end_after:
+                end_event.set()
+
         log.info("[Audio] 🎤 Offline STT (VAD-gated) — Recording...")
         self._is_listening = True
-        with sd.InputStream(samplerate=fs, channels=1, callback=callback,
-                            blocksize=chunk_size):
-            while self._is_listening: # Changed from while True:
-                time.sleep(0.1)
-                elapsed = time.time() - recording_start
-
-                if speech_detected and silent_chunks >= (silence_duration / 0.1):
-                    break
-                if elapsed > max_duration:
-                    break
-                if not speech_detected and elapsed > 10:
-                    log.info("[Audio] No speech detected in 10s. Giving up.")
-                    return STTResult(text="Error: No speech detected.",
-                                    provider=provider)
-
-        if not recording:
+        with sd.InputStream(samplerate=fs, channels=1, dtype="int16", latency="low",
+                            callback=callback, blocksize=chunk_size):
+            if not end_event.wait(timeout=10) and not speech_detected:
+                log.info("[Audio] No speech detected in 10s. Giving up.")
+                return STTResult(text="Error: No speech detected.",
+                                provider=provider)
+            end_event.wait(timeout=max(0.0, max_duration - (time.time() - recording_start)))
+
+        if self._ring_count == 0:
             return STTResult(text="Error: No audio captured.", provider=provider)
 
-        audio = np.concatenate(recording, axis=0).flatten().astype(np.float32)
+        audio = self._ring_read()
         duration = len(audio) / fs
 
         # Transcribe
@@ -499,7 +939,7 @@ class SherpaAudioStack:
         log.info(f"[Audio] Transcribed (offline): '{text}' "
                  f"(confidence={confidence:.2f}, duration={duration:.1f}s)")
 
-        # Flush VAD state
+        # Flush VAD state; reset() may race with callback exit so we still lock it
         if self._vad is not None:
             with self._lock:
                 self._vad.reset()
@@ -536,18 +976,13 @@ class SherpaAudioStack:
                         return 0.0
 
                     # Heuristic: well-formed speech has ~4-6 chars per token
-                    chars_per_token = text_len / max(len(tokens), 1)
-                    # Good range is 2-8 chars/token
-                    if 2 <= chars_per_token <= 8:
-                        confidence = 0.85
-                    elif 1 <= chars_per_token <= 12:
-                        confidence = 0.65
-                    else:
-                        confidence = 0.40
-                    return min(confidence, 1.0)
-
-            # Fallback: text-length-based heuristic
-            text = result.text.strip() if hasattr(result, 'text') else ""
+                    idx = min(text_len // len(tokens), len(_CONF_BY_CHARS_PER_TOKEN) - 1)
+                    return _CONF_BY_CHARS_PER_TOKEN[idx]
+
+            # Fallback: text-length-based heuristic (online recognizers return
+            # a plain str from get_result)
+            text = result if isinstance(result, str) else getattr(result, 'text', "")
+            text = text.strip()
             if not text:
                 return 0.0
             if len(text) < 3:
@@ -581,10 +1016,9 @@ class SherpaAudioStack:
         if self._tts_engine is not None:
             return
 
-        sherpa = _import_sherpa()
+        sherpa = self._get_sherpa()
         if sherpa is None:
             return
-        self._sherpa = sherpa
 
         tts_type = self.tts_cfg.get("type", "piper")
         model_path = self.tts_cfg.get("model_path", "")
@@ -593,7 +1027,15 @@ class SherpaAudioStack:
             log.warning(f"[Audio] TTS model not found at {model_path}. TTS disabled.")
             return
 
-        log.info(f"[Audio] Loading TTS engine: {tts_type} on {self.provider}...")
+        # On CPU, transparently prefer the weight-only INT8 sibling if packaged
+        # (scripts/pull_models.sh w8a16); dynamic INT8 is far slower for VITS
+        if self.provider == "cpu":
+            w8a16_path = model_path[:-len(".onnx")] + "-w8a16.onnx"
+            if model_path.endswith(".onnx") and os.path.exists(w8a16_path):
+                model_path = w8a16_path
+
+        log.info(f"[Audio] Loading TTS engine: {tts_type} on {self.provider} "
+                 f"({os.path.basename(model_path)})...")
         start = time.time()
 
         try:
@@ -610,7 +1052,8 @@ class SherpaAudioStack:
                 
                 model_config = sherpa.OfflineTtsModelConfig(
                     kokoro=kokoro_config,
-                    provider=self.provider
+                    provider=self.provider,
+                    num_threads=self._tts_threads,
                 )
                 
                 tts_config = sherpa.OfflineTtsConfig(
@@ -624,7 +1067,7 @@ class SherpaAudioStack:
                 self._tts_engine = sherpa.OfflineTts(
                     model=model_path,
                     provider=self.provider,
-                    num_threads=2,
+                    num_threads=self._tts_threads,
                 )
         except Exception as e:
             log.error(f"[Audio] Failed to load TTS: {e}")
@@ -640,7 +1083,8 @@ class SherpaAudioStack:
             log.warning("[Audio] Cannot speak — sounddevice not available.")
             return
 
-        self._init_tts()
+        with self._tts_init_lock:
+            self._init_tts()
         if self._tts_engine is None:
             log.warning("[Audio] TTS not available. Skipping speech output.")
             return
@@ -649,15 +1093,55 @@ class SherpaAudioStack:
         start = time.time()
 
         try:
-            audio = self._tts_engine.generate(text, sid=0, speed=1.0)
-            samples = np.array(audio.samples, dtype=np.float32)
-            sd.play(samples, samplerate=audio.sample_rate)
-            sd.wait()
+            self._speak_streaming(sd, text)
         except Exception as e:
             log.error(f"[Audio] TTS playback error: {e}")
 
         log.info(f"[Audio] Speech completed in {time.time() - start:.2f}s")
 
+    def _speak_streaming(self, sd, text: str):
+        """
+        Play each synthesized chunk as soon as sherpa emits it, instead of
+        waiting for the whole utterance. PortAudio pulls from a deque of
+        chunks in its own callback, so synthesis of the next sentence
+        overlaps playback with no writer thread in between.
+        """
+        chunks: collections.deque = collections.deque()
+        generated = threading.Event()   # synthesis finished
+        drained = threading.Event()     # stream played everything and stopped
+        offset = 0                      # read position inside chunks[0]
+
+        def out_cb(outdata, frames, time_info, status):
+            nonlocal offset
+            out = outdata[:, 0]
+            filled = 0
+            while filled < frames and chunks:
+                chunk = chunks[0]
+                n = min(frames - filled, len(chunk) - offset)
+                out[filled:filled + n] = chunk[offset:offset + n]
+                filled += n
+                offset += n
+                if offset == len(chunk):
+                    chunks.popleft()
+                    offset = 0
+            if filled < frames:
+                out[filled:] = 0  # underrun (synthesis behind) or end of speech
+                if generated.is_set() and not chunks:
+                    raise sd.CallbackStop
+
+        def on_chunk(samples, progress):
+            chunks.append(_as_float32(samples))
+            return 1  # keep generating
+
+        with sd.OutputStream(samplerate=self._tts_engine.sample_rate, channels=1,
+                             dtype="float32", latency="low", callback=out_cb,
+                             finished_callback=drained.set):
+            try:
+                self._tts_engine.generate(text, sid=0, speed=1.0, callback=on_chunk)
+            finally:
+                generated.set()
+            drained.wait()
+
     # ------------------------------------------------------------------
     # Capability checks
     # ------------------------------------------------------------------
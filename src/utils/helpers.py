@@ -1,18 +1,48 @@
 import subprocess
 import psutil
 import os
+import time
+import functools
+
+# TTL cache for get_system_health_cached(): [timestamp, health dict]
+_HEALTH_TTL_S = 0.5
+_health_cache = [0.0, None]
+
+@functools.lru_cache(maxsize=None)
+def _nvml():
+    """
+    (pynvml, device handle) for GPU 0, initialised once per process; None on
+    CPU-only hosts or without nvidia-ml-py (installed with nvitop).
+    """
+    try:
+        import pynvml
+        pynvml.nvmlInit()
+        return pynvml, pynvml.nvmlDeviceGetHandleByIndex(0)
+    except Exception:
+        return None
+
+def _query_gpu():
+    """(vram_used MB, vram_total MB, utilization %) via NVML, else nvidia-smi."""
+    nvml = _nvml()
+    if nvml is not None:
+        pynvml, handle = nvml
+        mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+        util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+        return mem.used >> 20, mem.total >> 20, util.gpu
+    cmd = "nvidia-smi --query-gpu=memory.used,memory.total,utilization.gpu --format=csv,nounits,noheader"
+    output = subprocess.check_output(cmd.split()).decode('utf-8').strip().split(',')
+    return int(output[0]), int(output[1]), output[2].strip()
 
 def get_system_health():
     """Fetches VRAM, RAM, and CPU health for the ROG Strix G16."""
     health = {"gpu": "N/A", "vram_used": 0, "vram_total": 12227, "ram_percent": 0, "status": "Unknown"}
     
     try:
-        # 1. GPU / VRAM Check (Parsing nvidia-smi)
-        cmd = "nvidia-smi --query-gpu=memory.used,memory.total,utilization.gpu --format=csv,nounits,noheader"
-        output = subprocess.check_output(cmd.split()).decode('utf-8').strip().split(',')
-        health["vram_used"] = int(output[0])
-        health["vram_total"] = int(output[1])
-        health["gpu_util"] = f"{output[2]}%"
+        # 1. GPU / VRAM Check (NVML C API; nvidia-smi fork only as fallback)
+        vram_used, vram_total, gpu_util = _query_gpu()
+        health["vram_used"] = vram_used
+        health["vram_total"] = vram_total
+        health["gpu_util"] = f"{gpu_util}%"
         
         # 2. System RAM Check
         ram = psutil.virtual_memory()
@@ -29,3 +59,15 @@ def get_system_health():
         health["status"] = "❌ Hardware Monitor Error"
         
     return health
+
+def get_system_health_cached():
+    """
+    get_system_health() memoized for _HEALTH_TTL_S seconds, so widgets polling
+    in the same tick share one hardware query instead of issuing one each.
+    """
+    now = time.monotonic()
+    if _health_cache[1] is not None and now - _health_cache[0] < _HEALTH_TTL_S:
+        return _health_cache[1]
+    health = get_system_health()
+    _health_cache[:] = [now, health]
+    return health
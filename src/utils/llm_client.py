@@ -1,17 +1,40 @@
+import functools
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
 
+@functools.lru_cache(maxsize=None)
+def _shared_http_client():
+    """
+    One process-wide keep-alive pool for every ChatOpenAI the factories build,
+    so re-instantiating a client (e.g. on config reload) reuses warm sockets.
+    """
+    import httpx  # ships with langchain-openai; imported on first client build
+    return httpx.Client(
+        # Keep idle sockets across chat turns — httpx's 5 s default expiry drops
+        # them between messages, so every turn would reconnect
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=16, keepalive_expiry=300.0),
+        timeout=httpx.Timeout(600.0, connect=5.0),
+    )
+
 def LMStudioClient(base_url: str, model_name: str, temperature: float):
-    return ChatOpenAI(base_url=base_url, model=model_name, temperature=temperature, api_key="lm-studio")
+    # Local server: fail fast instead of hidden retry/backoff latency
+    return ChatOpenAI(base_url=base_url, model=model_name, temperature=temperature, api_key="lm-studio",
+                      http_client=_shared_http_client(), max_retries=0)
 
 def OllamaClient(base_url: str, model_name: str, temperature: float):
-    return ChatOpenAI(base_url=base_url, model=model_name, temperature=temperature, api_key="ollama")
+    return ChatOpenAI(base_url=base_url, model=model_name, temperature=temperature, api_key="ollama",
+                      http_client=_shared_http_client(), max_retries=0)
+
+@functools.lru_cache(maxsize=16)
+def _system_message(system_prompt):
+    """One SystemMessage per distinct prompt — skips pydantic validation per call."""
+    return SystemMessage(content=system_prompt)
 
 def call_lm_studio(llm, messages, system_prompt):
     """
     Calls the local LM Studio server with a system prompt and conversation history.
     """
-    formatted_messages = [SystemMessage(content=system_prompt)] + messages
+    formatted_messages = (_system_message(system_prompt), *messages)
     response = llm.invoke(formatted_messages)
     return response.content
 
@@ -19,7 +42,7 @@ def stream_lm_studio(llm, messages, system_prompt):
     """
     Streams tokens from LM Studio. Yields each token chunk as a string.
     """
-    formatted_messages = [SystemMessage(content=system_prompt)] + messages
+    formatted_messages = (_system_message(system_prompt), *messages)
     for chunk in llm.stream(formatted_messages):
         if chunk.content:
             yield chunk.content
@@ -3,40 +3,51 @@ from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 MAX_MESSAGES = 20
 KEEP_RECENT = 6
 
-def summarize_history(messages, llm, existing_summary=""):
-    """
-    When conversation history exceeds MAX_MESSAGES, compress older messages
-    into a rolling summary while keeping the most recent KEEP_RECENT messages.
-    
-    Returns (summary_str, trimmed_messages).
-    """
-    if len(messages) <= MAX_MESSAGES:
-        return existing_summary, messages
-
-    # Split: older messages to summarize, recent to keep
-    older = messages[:-KEEP_RECENT]
-    recent = messages[-KEEP_RECENT:]
+# Transcript speaker labels, dispatched on exact message class
+_ROLES = {HumanMessage: "User", AIMessage: "Ikaris"}
 
-    # Build the conversation text for summarization
-    convo_lines = []
-    for msg in older:
-        role = "User" if isinstance(msg, HumanMessage) else "Ikaris"
-        content = msg.content if hasattr(msg, "content") else str(msg)
-        convo_lines.append(f"{role}: {content}")
+def summarize_history(messages, llm, existing_summary="", last_summarized_idx=0):
+    """
+    When the not-yet-summarized history exceeds MAX_MESSAGES, fold the older
+    messages into a rolling summary while keeping the most recent KEEP_RECENT.
 
-    conversation_text = "\n".join(convo_lines)
+    Incremental: messages[:last_summarized_idx] are already in existing_summary,
+    so only the turns since then are sent, alongside the previous summary.
 
-    # Include previous summary for continuity
-    prev = f"Previous summary:\n{existing_summary}\n\n" if existing_summary else ""
+    Returns (summary_str, trimmed_messages, new_summarized_idx).
+    """
+    if not existing_summary or last_summarized_idx > len(messages):
+        last_summarized_idx = 0  # No summary to extend, or history replaced — start over
+    if len(messages) - last_summarized_idx <= MAX_MESSAGES:
+        return existing_summary, messages, last_summarized_idx
+
+    # Split: new older messages to fold in, recent to keep
+    new_idx = len(messages) - KEEP_RECENT
+    older = messages[last_summarized_idx:new_idx]
+    recent = messages[-KEEP_RECENT:]
 
-    prompt = (
-        f"{prev}"
-        f"Conversation to summarize:\n{conversation_text}\n\n"
-        "Provide a concise but comprehensive summary of the above conversation. "
-        "Capture key topics discussed, decisions made, and any important context. "
-        "Keep it under 200 words."
+    # Build the conversation text for summarization (single pass, no line list)
+    conversation_text = "\n".join(
+        f"{_ROLES.get(type(msg), 'System')}: {msg.content}" for msg in older
     )
 
+    # Include previous summary for continuity; the LLM only merges the delta
+    if existing_summary:
+        prompt = (
+            f"Previous summary:\n{existing_summary}\n\n"
+            f"New conversation turns:\n{conversation_text}\n\n"
+            "Merge the previous summary with the new turns into one concise but "
+            "comprehensive summary. Capture key topics discussed, decisions made, "
+            "and any important context. Keep it under 200 words."
+        )
+    else:
+        prompt = (
+            f"Conversation to summarize:\n{conversation_text}\n\n"
+            "Provide a concise but comprehensive summary of the above conversation. "
+            "Capture key topics discussed, decisions made, and any important context. "
+            "Keep it under 200 words."
+        )
+
     summary_messages = [
         SystemMessage(content="You are a conversation summarizer. Be concise and factual."),
         HumanMessage(content=prompt),
@@ -45,4 +56,4 @@ def summarize_history(messages, llm, existing_summary=""):
     response = llm.invoke(summary_messages)
     new_summary = response.content
 
-    return new_summary, recent
+    return new_summary, recent, new_idx
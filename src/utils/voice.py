@@ -32,36 +32,55 @@ def record_until_silence(fs=16000, silence_threshold=0.01, silence_duration=1.5)
     """Records audio from the microphone until silence is detected."""
     print("--- Ikaris is listening... ---")
     
-    recording = []
-    silent_chunks = 0
     chunk_size = int(fs * 0.1) # 100ms chunks
+    # Preallocated capture (30s cap + one block), written by slice — no
+    # per-block copies or list growth on the audio thread, no final concat.
+    # Captured as int16 (half the bytes of float32); it is what the WAV needs
+    recording = np.empty((fs * 30 + chunk_size, 1), dtype=np.int16)
+    write_idx = 0
+    silent_chunks = 0
+    # Compare mean-square energy against threshold² in int16 units — no sqrt
+    threshold_sq = (silence_threshold * 32768.0) ** 2
+    scratch = np.empty(chunk_size, dtype=np.float32)  # int16 → float32 for sdot
     
     def callback(indata, frames, time, status):
-        nonlocal recording, silent_chunks
-        volume_norm = np.linalg.norm(indata) / np.sqrt(len(indata))
-        recording.append(indata.copy())
+        nonlocal write_idx, silent_chunks
+        flat = scratch[:frames]
+        np.copyto(flat, indata.reshape(-1), casting="unsafe")
+        volume_sq = float(np.dot(flat, flat)) / flat.size
+        n = min(len(indata), len(recording) - write_idx)
+        recording[write_idx:write_idx + n] = indata[:n]
+        write_idx += n
         
-        if volume_norm < silence_threshold:
+        if volume_sq < threshold_sq:
             silent_chunks += 1
         else:
             silent_chunks = 0
 
+    # Loop bounds are fixed for the whole recording — compute them once
+    max_silent_chunks = round(silence_duration / 0.1)
+    max_samples = fs * 30
+
     # Increase blocksize/latency slightly to prevent buffer underflows on Linux
-    with sd.InputStream(samplerate=fs, channels=1, callback=callback, blocksize=chunk_size):
-        while silent_chunks < (silence_duration / 0.1):
+    with sd.InputStream(samplerate=fs, channels=1, dtype="int16",
+                        callback=callback, blocksize=chunk_size):
+        while silent_chunks < max_silent_chunks:
             time.sleep(0.1)
             # Safety timeout (30 seconds)
-            if len(recording) > (fs * 30 / chunk_size):
+            if write_idx >= max_samples:
                 break
 
     print("--- Thinking... ---")
-    return np.concatenate(recording, axis=0), fs
+    return recording[:write_idx], fs
 
 def transcribe_audio(recording, fs):
     """Transcribes audio using Faster-Whisper."""
     temp_filename = "temp_voice.wav"
-    # Ensure clipping is avoided and normalized
-    audio_data = (recording * 32767).astype(np.int16)
+    # int16 captures go to the WAV as-is; float input is scaled (avoids clipping)
+    if recording.dtype == np.int16:
+        audio_data = recording
+    else:
+        audio_data = (recording * 32767).astype(np.int16)
     write(temp_filename, fs, audio_data)
     
     # GET THE MODEL HERE (LAZILY)
@@ -14,6 +14,8 @@ class WorkspaceManager:
     def initialize(self):
         self.root_dir = os.path.abspath("workspaces")
         self.active_workspace = "default"
+        # Workspace names whose sources/notes dirs were already ensured this run
+        self._created_dirs = set()
         
         # Don't create directories immediately, only when setting/using workspace
         self._load_state()
@@ -40,22 +42,31 @@ class WorkspaceManager:
         name = "".join(c for c in name if c.isalnum() or c in (' ', '_', '-')).strip().replace(' ', '_')
         if not name:
             name = "default"
+
+        # Re-selecting the active, already-created workspace is a no-op
+        if name == self.active_workspace and name in self._created_dirs:
+            return
             
         self.active_workspace = name
         ws_dir = os.path.join(self.root_dir, name)
         
         # Ensure workspace isolated directories exist
-        os.makedirs(os.path.join(ws_dir, "sources"), exist_ok=True)
-        os.makedirs(os.path.join(ws_dir, "notes"), exist_ok=True)
+        if name not in self._created_dirs:
+            os.makedirs(os.path.join(ws_dir, "sources"), exist_ok=True)
+            os.makedirs(os.path.join(ws_dir, "notes"), exist_ok=True)
+            self._created_dirs.add(name)
         self._save_state()
 
     def get_active_workspace(self) -> str:
         return self.active_workspace
         
     def get_workspaces(self) -> list:
-        if not os.path.exists(self.root_dir):
+        # scandir's DirEntry carries d_type from readdir — no stat per entry
+        try:
+            with os.scandir(self.root_dir) as it:
+                return sorted(e.name for e in it if e.is_dir())
+        except FileNotFoundError:
             return []
-        return sorted([d for d in os.listdir(self.root_dir) if os.path.isdir(os.path.join(self.root_dir, d))])
         
     def get_papers_dir(self) -> str:
         """Isolated PDF ingest directory."""
@@ -1,10 +1,42 @@
+import logging
+import os
 import sys
+import types
 from unittest.mock import MagicMock
 
+import pytest
+
+log = logging.getLogger(__name__)
+
+# Project root on sys.path once per session (test modules no longer each append it)
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+def _stub_module(name):
+    """Lightweight stand-in for a missing package: a real module object whose
+    unknown attributes become MagicMocks on first access (then cached on it),
+    instead of a whole MagicMock tree standing in for the package."""
+    mod = types.ModuleType(name)
+    mod.__path__ = []  # Importable as a package, so stubbed submodules resolve
+
+    def __getattr__(attr):
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        value = MagicMock(name=f"{name}.{attr}")
+        setattr(mod, attr, value)
+        return value
+
+    mod.__getattr__ = __getattr__
+    return mod
+
 # List of heavy dependencies to mock if missing
 # Perform mocking in a hook to ensure it runs early
 def pytest_configure(config):
-    print("DEBUG: Running pytest_configure in conftest.py")
+    # Registered here too so the marker is known when pytest-xdist isn't installed
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run all tests of the group on the same xdist worker"
+    )
     # List of heavy dependencies to mock if missing
     MOCK_MODULES = [
         'langchain_community',
@@ -37,5 +69,27 @@ def pytest_configure(config):
         try:
             __import__(mod_name)
         except ImportError:
-            sys.modules[mod_name] = MagicMock()
-            print(f"DEBUG: Mocked {mod_name}")
+            stub = sys.modules[mod_name] = _stub_module(mod_name)
+            parent, _, child = mod_name.rpartition('.')
+            if parent in sys.modules:
+                setattr(sys.modules[parent], child, stub)
+            log.debug("Mocked %s", mod_name)
+
+
+# Shared FAISS index stub for the retrieval tests (test_embeddings / test_evidence).
+# Built once per session; tests only set per-query results on it.
+@pytest.fixture(scope="session")
+def mock_faiss_db():
+    return MagicMock()
+
+
+@pytest.fixture
+def faiss_db(mock_faiss_db):
+    """Per-test view of the shared DB: call history, results and the paper_tool
+    query and index caches cleared."""
+    mock_faiss_db.reset_mock(return_value=True, side_effect=True)
+    # Cached query results or loaded stores would bypass the stub entirely
+    from src.tools import paper_tool
+    paper_tool.clear_query_cache()
+    paper_tool._index_cache.clear()
+    return mock_faiss_db
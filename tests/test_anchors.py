@@ -1,54 +1,44 @@
-import unittest
-import sys
-import os
+import re
 
-# Add src to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from unittest.mock import MagicMock
+import pytest
 
 # We verify purely the regex logic, so we rely on real imports.
-from src.tools.paper_tool import extract_metadata_anchors
-
-class TestLayer3Anchors(unittest.TestCase):
-    """Layer 3: Graph Pointers Tests"""
-
-    def test_anchor_extraction_sections(self):
-        text = "This is described in Section 4.5 and Sec. 10.2 later."
-        result = extract_metadata_anchors(text)
-        self.assertEqual(result['sections'], ['10.2', '4.5'])
-
-    def test_anchor_extraction_equations(self):
-        text = "As seen in Equation 3 and Eq. (5)."
-        result = extract_metadata_anchors(text)
-        self.assertEqual(result['equations'], ['3', '5'])
-
-    def test_anchor_extraction_figures(self):
-        text = "Figure 1 shows the architecture. Fig. 2 details the loop."
-        result = extract_metadata_anchors(text)
-        self.assertEqual(result['figures'], ['1', '2'])
-        
-    def test_anchor_extraction_tables(self):
-        text = "Table 4 lists results."
-        result = extract_metadata_anchors(text)
-        self.assertEqual(result['tables'], ['4'])
-
-    def test_hierarchy_inference(self):
-        """Test that equations are linked to the parent section in the chunk."""
-        text = "Section 3. Methodology. We define Equation 5 here."
-        result = extract_metadata_anchors(text)
-        
-        self.assertIn('hierarchy', result)
-        self.assertEqual(result['hierarchy']['parent_section'], '3')
-        self.assertEqual(result['hierarchy']['contains_equations'], ['5'])
-
-    def test_multiple_anchors_same_chunk(self):
-        text = "Section 2. Eq 1. Fig 3. Table 9."
-        result = extract_metadata_anchors(text)
-        self.assertEqual(result['sections'], ['2'])
-        self.assertEqual(result['equations'], ['1'])
-        self.assertEqual(result['figures'], ['3'])
-        self.assertEqual(result['tables'], ['9'])
-
-if __name__ == '__main__':
-    unittest.main()
+from src.tools.paper_tool import extract_metadata_anchors, _SECTION_BREAK
+
+# Layer 3: Graph Pointers Tests — (text, anchor kind, expected anchors in any order)
+ANCHOR_CASES = [
+    ("This is described in Section 4.5 and Sec. 10.2 later.", "sections", ['10.2', '4.5']),
+    ("As seen in Equation 3 and Eq. (5).", "equations", ['3', '5']),
+    ("Figure 1 shows the architecture. Fig. 2 details the loop.", "figures", ['1', '2']),
+    ("Table 4 lists results.", "tables", ['4']),
+    # Multiple anchors in the same chunk
+    ("Section 2. Eq 1. Fig 3. Table 9.", "sections", ['2']),
+    ("Section 2. Eq 1. Fig 3. Table 9.", "equations", ['1']),
+    ("Section 2. Eq 1. Fig 3. Table 9.", "figures", ['3']),
+    ("Section 2. Eq 1. Fig 3. Table 9.", "tables", ['9']),
+]
+
+
+@pytest.mark.parametrize("text,key,expected", ANCHOR_CASES)
+def test_anchor_extraction(text, key, expected):
+    # Anchors are deduplicated but returned in discovery order, not sorted
+    assert sorted(extract_metadata_anchors(text)[key]) == sorted(expected)
+
+
+def test_hierarchy_inference():
+    """Test that equations are linked to the parent section in the chunk."""
+    text = "Section 3. Methodology. We define Equation 5 here."
+    result = extract_metadata_anchors(text)
+
+    assert 'hierarchy' in result
+    assert result['hierarchy']['parent_section'] == '3'
+    assert result['hierarchy']['contains_equations'] == ['5']
+
+
+def test_section_break_splits_before_headings():
+    """Test that chunking prefers to break before numbered section headings."""
+    text = ("end of intro.\n2 Related Work\nPrior art.\n"
+            "3.1. Model\nWe use 2 layers.\n4 results were poor.\n")
+    pieces = re.split(_SECTION_BREAK, text)
+
+    assert [p.split("\n")[0] for p in pieces] == ["end of intro.", "2 Related Work", "3.1. Model"]
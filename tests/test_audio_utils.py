@@ -0,0 +1,178 @@
+import queue
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+# Pure-Python audio helpers — no sherpa-onnx, sounddevice or audio hardware needed
+from src.utils.audio import SherpaAudioStack, _BatchedCallback, _drain, _put_sentinel
+
+
+@pytest.mark.parametrize("result,expected", [
+    ("", 0.0),
+    ("hi", 0.3),
+    ("hello", 0.6),
+    ("hello there, ikaris", 0.8),
+    # Online recognizers return a plain str; offline ones a result object
+    (SimpleNamespace(text="  hello there, ikaris "), 0.8),
+    # ~5 chars/token is well-formed speech; under 1 char/token is not
+    (SimpleNamespace(text="hello world", tokens=["hello", " wor"], timestamps=[0.0, 0.4]), 0.85),
+    (SimpleNamespace(text="ab", tokens=list("abcd"), timestamps=[0.0] * 4), 0.40),
+])
+def test_extract_confidence_heuristic(result, expected):
+    assert SherpaAudioStack._extract_confidence(result) == expected
+
+
+def test_put_sentinel_gives_up_on_dead_worker():
+    """A decode worker that died must not leave the listener blocked on a full queue."""
+    q = queue.Queue(maxsize=1)
+    q.put("block")
+    dead = threading.Thread(target=lambda: None)
+    dead.start()
+    dead.join()
+
+    _put_sentinel(q, dead)  # Returns instead of blocking forever
+    _drain(q)
+    assert q.empty()
+
+
+def test_put_sentinel_reaches_live_worker():
+    q = queue.Queue(maxsize=1)
+    q.put("block")
+    seen = []
+
+    def worker():
+        while (item := q.get()) is not None:
+            seen.append(item)
+
+    t = threading.Thread(target=worker)
+    t.start()
+    _put_sentinel(q, t)
+    t.join(timeout=2)
+    assert not t.is_alive()
+    assert seen == ["block"]
+
+
+class _FakeInputStream:
+    """Stands in for sd.InputStream: feeds loud int16 blocks to the callback from a thread."""
+
+    def __init__(self, callback, blocksize, **kwargs):
+        self._callback = callback
+        self._blocksize = blocksize
+        self._stop = threading.Event()
+
+    def _feed(self):
+        block = np.full((self._blocksize, 1), 8000, dtype=np.int16)
+        while not self._stop.wait(0.001):
+            self._callback(block, self._blocksize, None, None)
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._feed, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def test_streaming_decode_error_reaches_caller():
+    """A recognizer error in the decode thread is raised from listen, not hung on."""
+    stack = SherpaAudioStack()
+    recognizer = MagicMock()
+    recognizer.create_stream.return_value.accept_waveform.side_effect = RuntimeError("decoder blew up")
+    sd = SimpleNamespace(InputStream=_FakeInputStream)
+    raised = []
+
+    def listen():
+        try:
+            stack._listen_streaming_vad(sd, 16000, 0.01, 1.5, recognizer, "cpu", False, False)
+        except RuntimeError as e:
+            raised.append(e)
+
+    t = threading.Thread(target=listen, daemon=True)
+    t.start()
+    t.join(timeout=5)
+
+    assert not t.is_alive(), "listener hung after the decode worker died"
+    assert str(raised[0]) == "decoder blew up"
+    assert stack._audio_q.empty()
+
+
+def _pcm(*values):
+    return np.array(values, dtype=np.int16)
+
+
+def test_ring_write_read_discard():
+    """Test that the capture ring converts int16 to float32 and keeps utterance order."""
+    stack = SherpaAudioStack()
+    stack._ring_reset(8)
+
+    view = stack._ring_write(_pcm(16384, -16384, 0))
+    np.testing.assert_array_equal(view, [0.5, -0.5, 0.0])
+    assert view.base is not None  # Unwrapped write hands back a view, not a copy
+
+    stack._ring_write(_pcm(1, 2))
+    stack._ring_discard(2)  # VAD rejected the last block
+    np.testing.assert_array_equal(stack._ring_read() * 32768, [16384, -16384, 0])
+
+
+def test_ring_wraps_oldest_first():
+    stack = SherpaAudioStack()
+    stack._ring_reset(4)
+    stack._ring = stack._ring[:4]  # Reset only grows; pin capacity to 4 for the wrap
+
+    stack._ring_write(_pcm(1, 2, 3))
+    wrapped = stack._ring_write(_pcm(4, 5, 6))  # Crosses the end of the ring
+
+    np.testing.assert_array_equal(wrapped * 32768, [4, 5, 6])
+    np.testing.assert_array_equal(stack._ring_read() * 32768, [3, 4, 5, 6])
+    stack._ring_discard(10)  # Clamped to what is held
+    assert len(stack._ring_read()) == 0
+
+
+def test_ring_reset_grows_only_when_needed():
+    stack = SherpaAudioStack()
+    ring = stack._ring
+    stack._ring_reset(16)
+    assert stack._ring is ring
+    stack._ring_reset(len(ring) + 1)
+    assert len(stack._ring) == len(ring) + 1
+
+
+def test_batched_callback_coalesces_partials():
+    """Test that partials are held back within the interval and only the newest is delivered."""
+    seen = []
+    cb = _BatchedCallback(seen.append, interval_s=3600, max_pending=3)
+    cb._last_emit = time.monotonic()  # As if it had just emitted
+
+    cb("h")
+    cb("he")
+    assert seen == []
+
+    cb("hel")  # Third pending update forces an emit
+    assert seen == ["hel"]
+
+    cb("hell")
+    cb("hello")
+    cb.flush()  # End of utterance delivers what was held back
+    cb.flush()  # ...exactly once
+    assert seen == ["hel", "hello"]
+
+
+def test_batched_callback_delivers_held_partial_on_deadline():
+    """Test that a held partial reaches the user without another update arriving."""
+    seen = []
+    cb = _BatchedCallback(seen.append, interval_s=0.05, max_pending=100)
+    cb._last_emit = time.monotonic()
+    cb("a")
+    cb("ab")
+    assert seen == []
+
+    time.sleep(0.2)  # Speaker paused: no further partials, no flush
+    assert seen == ["ab"]
+    cb.flush()
+    assert seen == ["ab"]
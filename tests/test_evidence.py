@@ -1,69 +1,152 @@
-import unittest
-from unittest.mock import MagicMock, patch
-import sys
+from types import SimpleNamespace
+from unittest.mock import patch
 import os
 
-# Add src to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import numpy as np
 
-from unittest.mock import MagicMock
-
-# Mock Dependencies
+# Layer 3.5: Evidence Assembly Tests
 # We use patch instead of global sys.modules hacks
 
 
-class TestLayer3_5Evidence(unittest.TestCase):
-    """Layer 3.5: Evidence Assembly Tests"""
-
-    def test_assemble_evidence_structure(self):
-        """Test that retrieval returns formatted evidence packets."""
-        mock_db = MagicMock()
-        
-        # Mock Doc
-        mock_doc = MagicMock()
-        mock_doc.page_content = "Raw extracted text."
-        mock_doc.metadata = {"sections": ["2.1"], "equations": ["4"]}
-        
-        # Return doc with score 0.0 (perfect match)
-        mock_db.similarity_search_with_score.return_value = [(mock_doc, 0.0)]
-        
-        with patch('src.tools.paper_tool.FAISS.load_local', return_value=mock_db), \
-             patch('src.tools.paper_tool.get_embeddings'), \
-             patch('os.path.exists', return_value=True):
-            from src.tools.paper_tool import query_papers
-            evidence = query_papers("query")
-            
-        pkt = evidence[0]
-        
-        # Assert Structure
-        self.assertIn("content", pkt)
-        self.assertIn("metadata", pkt)
-        self.assertIn("relevance", pkt)
-        
-        # Assert Logic
-        self.assertEqual(pkt['content'], "Raw extracted text.")
-        self.assertEqual(pkt['metadata']['sections'], ["2.1"])
-        self.assertEqual(pkt['relevance'], 1.0) # 1 / (1+0)
-
-    def test_relevance_normalization(self):
-        """Test relevance score calculation."""
-        # Using the same mock setup
-        mock_db = MagicMock()
-        
-        mock_doc = MagicMock()
-        mock_doc.page_content = "X"
-        mock_doc.metadata = {}
-        
-        # Score 1.0 (Distance = 1.0) -> Relevance = 1/(1+1) = 0.5
-        mock_db.similarity_search_with_score.return_value = [(mock_doc, 1.0)]
-        
-        with patch('src.tools.paper_tool.FAISS.load_local', return_value=mock_db), \
-             patch('src.tools.paper_tool.get_embeddings'), \
-             patch('os.path.exists', return_value=True):
-            from src.tools.paper_tool import query_papers
-            evidence = query_papers("query")
-                    
-        self.assertEqual(evidence[0]['relevance'], 0.5)
-
-if __name__ == '__main__':
-    unittest.main()
+def test_assemble_evidence_structure(faiss_db):
+    """Test that retrieval returns formatted evidence packets."""
+    mock_db = faiss_db
+
+    # Mock Doc
+    mock_doc = SimpleNamespace(page_content="Raw extracted text.",
+                               metadata={"sections": ["2.1"], "equations": ["4"]})
+
+    # Return doc with score 0.0 (perfect match)
+    mock_db.similarity_search_with_score.return_value = [(mock_doc, 0.0)]
+
+    with patch('src.tools.paper_tool.FAISS.load_local', return_value=mock_db), \
+         patch('src.tools.paper_tool.get_embeddings'), \
+         patch.object(os.path, 'exists', return_value=True):
+        from src.tools.paper_tool import query_papers
+        evidence = query_papers("query")
+
+    pkt = evidence[0]
+
+    # Assert Structure
+    assert "content" in pkt
+    assert "metadata" in pkt
+    assert "relevance" in pkt
+
+    # Assert Logic
+    assert pkt['content'] == "Raw extracted text."
+    assert pkt['metadata']['sections'] == ["2.1"]
+    assert pkt['relevance'] == 1.0 # 1 / (1+0)
+
+def test_relevance_normalization(faiss_db):
+    """Test relevance score calculation."""
+    # Using the same mock setup
+    mock_db = faiss_db
+
+    mock_doc = SimpleNamespace(page_content="X", metadata={})
+
+    # Score 1.0 (Distance = 1.0) -> Relevance = 1/(1+1) = 0.5
+    mock_db.similarity_search_with_score.return_value = [(mock_doc, 1.0)]
+
+    with patch('src.tools.paper_tool.FAISS.load_local', return_value=mock_db), \
+         patch('src.tools.paper_tool.get_embeddings'), \
+         patch.object(os.path, 'exists', return_value=True):
+        from src.tools.paper_tool import query_papers
+        evidence = query_papers("query")
+
+    assert evidence[0]['relevance'] == 0.5
+
+def test_query_papers_batch(faiss_db):
+    """Test that batched retrieval runs one FAISS search and splits results per query."""
+    mock_db = faiss_db
+    docs = {
+        "a": SimpleNamespace(page_content="Chunk A", metadata={"sections": ["1"]}),
+        "b": SimpleNamespace(page_content="Chunk B", metadata={}),
+    }
+    mock_db.index_to_docstore_id = {0: "a", 1: "b"}
+    mock_db.docstore.search.side_effect = docs.__getitem__
+    # Query 1 -> [a (0.0), b (1.0)]; query 2 -> [b (0.0), padding]
+    mock_db.index.search.return_value = (
+        np.array([[0.0, 1.0], [0.0, 3.4e38]], dtype=np.float32),
+        np.array([[0, 1], [1, -1]], dtype=np.int64),
+    )
+
+    with patch('src.tools.paper_tool.FAISS.load_local', return_value=mock_db), \
+         patch('src.tools.paper_tool.get_embeddings') as mock_get_embeddings, \
+         patch('src.tools.paper_tool.WorkspaceManager'), \
+         patch.object(os.path, 'exists', return_value=True):
+        mock_get_embeddings.return_value.embed_documents.return_value = [[0.1, 0.2], [0.3, 0.4]]
+        from src.tools.paper_tool import query_papers_batch
+        batches = query_papers_batch(["q1", "q2"], k=2)
+
+    mock_db.index.search.assert_called_once()
+    xq, k = mock_db.index.search.call_args[0]
+    assert xq.shape == (2, 2)
+    assert xq.dtype == np.float32
+    assert k == 2
+
+    assert [[e.text for e in b] for b in batches] == [["Chunk A", "Chunk B"], ["Chunk B"]]
+    assert batches[0][0].relevance == 1.0
+    assert batches[0][1].relevance == 0.5
+    assert batches[0][0].meta["sections"] == ["1"]
+
+def test_query_cache_hits(faiss_db):
+    """Test that a repeated query is served from the cache without a second search."""
+    mock_db = faiss_db
+    mock_doc = SimpleNamespace(page_content="Cached chunk.", metadata={})
+    mock_db.similarity_search_with_score.return_value = [(mock_doc, 0.0)]
+
+    with patch('src.tools.paper_tool.FAISS.load_local', return_value=mock_db) as mock_load_local, \
+         patch('src.tools.paper_tool.get_embeddings'), \
+         patch('src.tools.paper_tool.WorkspaceManager'), \
+         patch.object(os.path, 'exists', return_value=True):
+        from src.tools.paper_tool import query_papers, query_papers_batch
+        first = query_papers("x")
+        second = query_papers("x")
+        batched = query_papers_batch(["x"])
+
+    assert mock_db.similarity_search_with_score.call_count == 1
+    assert mock_load_local.call_count == 1
+    mock_db.index.search.assert_not_called()
+    assert second == first
+    assert second is not first  # Callers get their own list
+    assert batched == [first]
+
+def test_loaded_index_reused_until_rewritten(faiss_db):
+    """Test that the loaded store is kept across queries and reloaded once the index file changes."""
+    mock_db = faiss_db
+    mock_db.similarity_search_with_score.return_value = []
+    stamp = SimpleNamespace(st_mtime_ns=1, st_size=100)
+
+    with patch('src.tools.paper_tool.FAISS.load_local', return_value=mock_db) as mock_load_local, \
+         patch('src.tools.paper_tool.get_embeddings'), \
+         patch('src.tools.paper_tool.WorkspaceManager'), \
+         patch.object(os.path, 'exists', return_value=True), \
+         patch.object(os, 'stat', side_effect=lambda _: stamp):
+        from src.tools.paper_tool import query_papers
+        query_papers("a")
+        query_papers("b")
+        assert mock_load_local.call_count == 1
+
+        stamp = SimpleNamespace(st_mtime_ns=2, st_size=100)  # Re-ingested
+        query_papers("c")
+        assert mock_load_local.call_count == 2
+
+def test_query_cache_misses_after_index_rewrite(faiss_db):
+    """Test that a cached answer is not reused once the index file on disk changes."""
+    mock_db = faiss_db
+    mock_db.similarity_search_with_score.return_value = []
+    stamp = SimpleNamespace(st_mtime_ns=1, st_size=100)
+
+    with patch('src.tools.paper_tool.FAISS.load_local', return_value=mock_db), \
+         patch('src.tools.paper_tool.get_embeddings'), \
+         patch('src.tools.paper_tool.WorkspaceManager'), \
+         patch.object(os.path, 'exists', return_value=True), \
+         patch.object(os, 'stat', side_effect=lambda _: stamp):
+        from src.tools.paper_tool import query_papers
+        query_papers("x")
+        query_papers("x")
+        assert mock_db.similarity_search_with_score.call_count == 1
+
+        stamp = SimpleNamespace(st_mtime_ns=2, st_size=120)  # Rewritten by another process
+        query_papers("x")
+        assert mock_db.similarity_search_with_score.call_count == 2
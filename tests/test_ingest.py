@@ -1,13 +1,9 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, patch
 import sys
 import os
 
-# Add src to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from unittest.mock import MagicMock
-
 # We rely on patch for mocking, removing global sys.modules hacks to allow real imports if locally available.
 # Note: In CI without dependencies installed, this might fail unless we mock imports differently,
 # but the user instruction is 'Mock IO. Never mock logic.' meaning we should assume env is valid or patch selectively.
@@ -15,46 +11,65 @@ from unittest.mock import MagicMock
 class TestLayer1Ingest(unittest.TestCase):
     """Layer 1: Immutable Source Tests"""
 
-    @patch('src.tools.paper_tool.PyPDFLoader')
-    @patch('src.tools.paper_tool.DirectoryLoader')
-    @patch('src.tools.paper_tool.RecursiveCharacterTextSplitter')
-    @patch('src.tools.paper_tool.FAISS')
-    @patch('src.tools.paper_tool.get_embeddings') # Mock the lazy loader
-    @patch('os.path.exists')
-    @patch('os.makedirs')
-    def test_chunks_are_stable(self, mock_makedirs, mock_exists, mock_get_embeddings, mock_faiss, mock_splitter, mock_dir_loader, mock_pdf_loader):
+    def test_chunks_are_stable(self):
         """Test that ingestion produces consistent chunks from the same input."""
-        # Setup Mocks
-        mock_exists.return_value = True # Folder exists, proceed to ingest
-        
-        # Mock Documents
-        mock_doc = MagicMock()
-        mock_doc.page_content = "Test content for stability check."
-        mock_doc.metadata = {"page": 1}
-        
-        mock_loader_instance = mock_dir_loader.return_value
-        mock_loader_instance.load.return_value = [mock_doc]
-        
-        # Mock Splitter
-        mock_splitter_instance = mock_splitter.return_value
-        mock_splitter_instance.split_documents.return_value = [mock_doc, mock_doc] # simulate split
-        
-        from src.tools.paper_tool import ingest_papers
-        
-        # Run ingestion
-        result = ingest_papers()
-        
-        # Verify interactions
-        self.assertTrue(mock_dir_loader.called)
-        self.assertTrue(mock_splitter.called)
-        self.assertIn("Successfully indexed", result)
-        
-        # Consistency check: Logic should be deterministic given same mocks
-        # In a real scenario, we'd hash the chunks, but here we verify the flow is called correctly
-        mock_faiss.from_documents.assert_called_once()
-    
-    @patch('src.tools.paper_tool.DirectoryLoader')
-    def test_no_empty_chunks(self, mock_dir_loader):
+        # One patcher for the paper_tool collaborators; os attrs patched by object
+        with patch.multiple('src.tools.paper_tool',
+                            PyPDFLoader=DEFAULT,
+                            RecursiveCharacterTextSplitter=DEFAULT,
+                            FAISS=DEFAULT,
+                            get_embeddings=DEFAULT) as mocks, \
+             patch.object(os.path, 'exists', return_value=True), \
+             patch.object(os, 'makedirs'), \
+             patch('src.tools.paper_tool.glob.glob', return_value=["paper.pdf"]):  # Folder exists, proceed to ingest
+            mock_pdf_loader = mocks['PyPDFLoader']
+            mock_splitter = mocks['RecursiveCharacterTextSplitter']
+            mock_faiss = mocks['FAISS']
+
+            # Mock Documents
+            mock_doc = SimpleNamespace(page_content="Test content for stability check.",
+                                       metadata={"page": 1})
+
+            mock_loader_instance = mock_pdf_loader.return_value
+            mock_loader_instance.load.return_value = [mock_doc]
+
+            # Mock Splitter
+            mock_splitter_instance = mock_splitter.return_value
+            mock_splitter_instance.split_documents.return_value = [mock_doc, mock_doc] # simulate split
+
+            from src.tools.paper_tool import ingest_papers
+
+            # Run ingestion
+            result = ingest_papers()
+
+            # Verify interactions
+            mock_pdf_loader.assert_called_once_with("paper.pdf")
+            self.assertTrue(mock_splitter.called)
+            self.assertIn("Successfully indexed", result)
+
+            # Consistency check: Logic should be deterministic given same mocks
+            # In a real scenario, we'd hash the chunks, but here we verify the flow is called correctly
+            mock_faiss.from_embeddings.assert_called_once()
+            # All chunks embedded in a single batched call
+            mocks['get_embeddings'].return_value.embed_documents.assert_called_once_with(
+                ["Test content for stability check."] * 2)
+
+    @patch('src.tools.paper_tool.PyPDFLoader')
+    def test_pdf_suffix_any_case(self, mock_pdf_loader):
+        """Test that ingest picks up .pdf in any case, the same set the sidebar lists."""
+        from src.tools.paper_tool import _load_pdfs, is_pdf
+
+        names = ["a.pdf", "b.PDF", "c.Pdf", "notes.txt", "d.pdf.bak", "pdf"]
+        self.assertEqual([n for n in names if is_pdf(n)], ["a.pdf", "b.PDF", "c.Pdf"])
+
+        mock_pdf_loader.return_value.load.return_value = []
+        with patch('src.tools.paper_tool.glob.glob', return_value=[f"papers/{n}" for n in names]):
+            _load_pdfs("papers")
+        loaded = [c.args[0] for c in mock_pdf_loader.call_args_list]
+        self.assertEqual(loaded, ["papers/a.pdf", "papers/b.PDF", "papers/c.Pdf"])
+
+    @patch('src.tools.paper_tool.PyPDFLoader')
+    def test_no_empty_chunks(self, mock_pdf_loader):
         """Test that we don't index empty documents."""
         # This would require refactoring paper_tool to explicitly filter, 
         # but for now we verify the loader is invoked.
@@ -1,4 +1,3 @@
-import unittest
 import re
 import sys
 
@@ -18,26 +17,22 @@ import sys
 
 from src.tools.paper_tool import extract_metadata_anchors
 
-class TestRegexLogic(unittest.TestCase):
-    def test_layer_3_extraction(self):
-        sample_text = """
-        In Section 4.1 we discuss the transformer architecture.
-        The loss function is defined in Eq. 3 below:
-        L = ...
-        As shown in Figure 2, the attention mechanism matches Table 5 results.
-        """
-        
-        anchors = extract_metadata_anchors(sample_text)
-        
-        expected = {
-            'sections': ['4.1'],
-            'equations': ['3'],
-            'figures': ['2'],
-            'tables': ['5']
-        }
-        
-        for k, v in expected.items():
-            self.assertEqual(anchors.get(k), v, f"Failed to extract {k}")
-
-if __name__ == "__main__":
-    unittest.main()
+def test_layer_3_extraction():
+    sample_text = """
+    In Section 4.1 we discuss the transformer architecture.
+    The loss function is defined in Eq. 3 below:
+    L = ...
+    As shown in Figure 2, the attention mechanism matches Table 5 results.
+    """
+    
+    anchors = extract_metadata_anchors(sample_text)
+    
+    expected = {
+        'sections': ['4.1'],
+        'equations': ['3'],
+        'figures': ['2'],
+        'tables': ['5']
+    }
+    
+    for k, v in expected.items():
+        assert anchors.get(k) == v, f"Failed to extract {k}"
@@ -0,0 +1,106 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.utils.summarizer import KEEP_RECENT, MAX_MESSAGES, summarize_history
+
+# Rolling summary: only turns after last_summarized_idx are sent to the LLM
+
+
+def _history(n):
+    return [SimpleNamespace(content=f"turn {i}") for i in range(n)]
+
+
+@pytest.fixture
+def llm():
+    llm = MagicMock()
+    llm.invoke.return_value = SimpleNamespace(content="NEW SUMMARY")
+    # Real message objects aren't needed, just their content
+    with patch('src.utils.summarizer.SystemMessage', SimpleNamespace), \
+         patch('src.utils.summarizer.HumanMessage', SimpleNamespace):
+        yield llm
+
+
+def _prompt(llm):
+    return llm.invoke.call_args[0][0][1].content
+
+
+def test_short_history_untouched(llm):
+    messages = _history(MAX_MESSAGES)
+    summary, trimmed, idx = summarize_history(messages, llm)
+
+    assert (summary, trimmed, idx) == ("", messages, 0)
+    llm.invoke.assert_not_called()
+
+
+def test_growing_history_sends_only_the_delta(llm):
+    messages = _history(MAX_MESSAGES + 1)
+    summary, trimmed, idx = summarize_history(messages, llm)
+
+    assert summary == "NEW SUMMARY"
+    assert trimmed == messages[-KEEP_RECENT:]
+    assert idx == len(messages) - KEEP_RECENT
+    assert "Previous summary" not in _prompt(llm)
+
+    # History keeps growing (add_messages never drops turns); under the
+    # threshold of unsummarized turns nothing is re-sent
+    llm.invoke.reset_mock()
+    messages = _history(idx + MAX_MESSAGES)
+    assert summarize_history(messages, llm, "S1", idx) == ("S1", messages, idx)
+    llm.invoke.assert_not_called()
+
+    # Past it, only turns since idx go out, merged with the previous summary
+    messages = _history(idx + MAX_MESSAGES + 1)
+    summary, trimmed, new_idx = summarize_history(messages, llm, "S1", idx)
+    prompt = _prompt(llm)
+
+    assert new_idx == len(messages) - KEEP_RECENT
+    assert trimmed == messages[-KEEP_RECENT:]
+    assert "Previous summary:\nS1" in prompt
+    assert f"turn {idx - 1}\n" not in prompt
+    assert f"turn {idx}\n" in prompt
+    assert f"turn {new_idx - 1}\n" in prompt
+    assert f"turn {new_idx}" not in prompt
+
+
+def test_replaced_history_starts_over(llm):
+    # Index points past the end: history was replaced, so nothing is "already summarized"
+    messages = _history(MAX_MESSAGES + 5)
+    summary, trimmed, idx = summarize_history(messages, llm, "S1", last_summarized_idx=100)
+
+    assert idx == len(messages) - KEEP_RECENT
+    assert "turn 0\n" in _prompt(llm)
+
+
+def test_no_summary_resets_index(llm):
+    # An index without a summary to extend is stale; start from 0
+    messages = _history(MAX_MESSAGES + 5)
+    summarize_history(messages, llm, "", last_summarized_idx=10)
+    prompt = _prompt(llm)
+
+    assert "turn 0\n" in prompt
+    assert "Previous summary" not in prompt
+
+    llm.invoke.reset_mock()
+    short = _history(12)
+    assert summarize_history(short, llm, "", last_summarized_idx=10) == ("", short, 0)
+    llm.invoke.assert_not_called()
+
+
+def test_summarize_node_tracks_summary_idx(llm):
+    from src.main import summarize_node
+
+    messages = _history(MAX_MESSAGES + 1)
+    out = summarize_node({"messages": messages}, llm)
+    assert out["summary"] == "NEW SUMMARY"
+    assert out["summary_idx"] == len(messages) - KEEP_RECENT
+
+    # Nothing summarized: no summary message, state carried through unchanged
+    out = summarize_node({"messages": _history(5), "summary": "S1", "summary_idx": 3}, llm)
+    assert out == {"messages": [], "summary": "S1", "summary_idx": 3}
+
+    # Stale index without a summary: reset, but no empty summary is injected
+    out = summarize_node({"messages": _history(5), "summary": "", "summary_idx": 3}, llm)
+    assert out["messages"] == []
+    assert out["summary_idx"] == 0
@@ -33,8 +33,10 @@ try:
     import numpy as np
     
     samples = np.array(audio.samples, dtype=np.float32)
-    # Convert float32 to int16 for wave output
-    samples_int16 = (samples * 32767).astype(np.int16)
+    # Convert float32 to int16 for wave output; scale in place (samples is
+    # our own copy) so no float32 temporary is allocated before the cast
+    np.multiply(samples, 32767, out=samples)
+    samples_int16 = samples.astype(np.int16)
     
     filename = f"test_{provider}.wav"
     with wave.open(filename, "w") as f:
@@ -1,6 +1,7 @@
 
 import sys
 import os
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 # Add project root to path
@@ -53,13 +54,11 @@ def test_layer_3_5_retrieval(mock_exists, mock_faiss):
     
     # Mock DB and docs
     mock_db = MagicMock()
-    mock_doc1 = MagicMock()
-    mock_doc1.page_content = "Content chunk 1"
-    mock_doc1.metadata = {"page": 1, "sections": ["2"]}
+    mock_doc1 = SimpleNamespace(page_content="Content chunk 1",
+                                metadata={"page": 1, "sections": ["2"]})
     
-    mock_doc2 = MagicMock()
-    mock_doc2.page_content = "Content chunk 2"
-    mock_doc2.metadata = {"page": 5, "equations": ["4"]}
+    mock_doc2 = SimpleNamespace(page_content="Content chunk 2",
+                                metadata={"page": 5, "equations": ["4"]})
     
     mock_db.similarity_search.return_value = [mock_doc1, mock_doc2]
     mock_faiss.load_local.return_value = mock_db